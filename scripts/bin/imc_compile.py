@@ -514,7 +514,7 @@ def _move_dpkg_files():
     bin_path = fix_full_path(DefaultPaths.COMPILED_TOOL_BINARY)
     generic_test = fix_full_path("/" + DefaultPaths.GENERIC_TEST)
     licenses_path = fix_full_path(DefaultPaths.LICENSES)
-    dpkg_path = fix_full_path(DefaultPaths.BUILD + DefaultPaths.DPKG)
+    dpkg_path = fix_full_path(DefaultPaths.BUILD_DPKG)
     # Move debian package exec and aux files
     _print_subheaders("Moving debian package  executables", False)
     process = subprocess.Popen(["mv", "intelligentmemorychecker", bin_path])
@@ -636,7 +636,7 @@ def _build_dpkg():
     bin_path = fix_full_path(DefaultPaths.COMPILED_TOOL_BINARY)
     generic_test = fix_full_path("/" + DefaultPaths.GENERIC_TEST)
     licenses_path = fix_full_path(DefaultPaths.LICENSES)
-    dpkg_path = fix_full_path(DefaultPaths.BUILD + DefaultPaths.DPKG)
+    dpkg_path = fix_full_path(DefaultPaths.BUILD_DPKG)
     # Make debian package files folder
     process = subprocess.Popen(["mkdir", dpkg_path])
     (stdout, stderr) = process.communicate()
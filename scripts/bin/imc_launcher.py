@@ -316,21 +316,21 @@ def _parse_args(argv: List[str]):
     """ All valid parameters to modify test case through command line."""
     # Global control
     test_generator.add_argument(
-        f"--{ParameterIdentifier.GLOBAL_ITERATIONS.value}",
+        f"--{ParameterIdentifier.GLOBAL_ITERATIONS}",
         metavar="NUMBER",
         default=1,
         help=" amount of iterations the tool will run "
         + "if time is selected skip this parameter",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.GLOBAL_TIME_TO_EXECUTE.value}",
+        f"--{ParameterIdentifier.GLOBAL_TIME_TO_EXECUTE}",
         metavar="<TIME_UNIT>",
         help="control execution time, if iterations is selected "
         + "skip this parameter",
     )
     # todo action to verify global iterations is not defined
     test_generator.add_argument(
-        f"--{ParameterIdentifier.FLOW_TYPE.value}",
+        f"--{ParameterIdentifier.FLOW_TYPE}",
         metavar="<flow type>",
         help="select flow type to run",
     )
@@ -371,17 +371,17 @@ def _parse_args(argv: List[str]):
         help="valid memory address on hex format",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.ITERATIONS.value}",
+        f"--{ParameterIdentifier.ITERATIONS}",
         metavar="NUMBER",
         help="iterations on inner executions",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.ADDRESS_ALGORITHM_TYPE.value}",
+        f"--{ParameterIdentifier.ADDRESS_ALGORITHM_TYPE}",
         metavar="<algorithm type>",
         help="supported address algorithm by the flow",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.DATA_ALGORITHM_TYPE.value}",
+        f"--{ParameterIdentifier.DATA_ALGORITHM_TYPE}",
         metavar="<algorithm type>",
         help="supported data algorithm by the flow",
     )
@@ -410,7 +410,7 @@ def _parse_args(argv: List[str]):
         f"--{ALLOW_ALIASING}", metavar="BOOL", help="aliasing flag"
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.OPCODE.value}",
+        f"--{ParameterIdentifier.OPCODE}",
         metavar="<opcode>",
         default="LEGACY",
         help="{}".format(
@@ -419,29 +419,29 @@ def _parse_args(argv: List[str]):
     )
     """ Flow  configuration commands """
     test_generator.add_argument(
-        f"--{ParameterIdentifier.ALIGNMENT.value}",
+        f"--{ParameterIdentifier.ALIGNMENT}",
         metavar="NUMBER",
         help=" alignment on writing/reading",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.DATA_BURSTS.value}",
+        f"--{ParameterIdentifier.DATA_BURSTS}",
         metavar="NUMBER",
         help="number of flows for burster flow",
     )
     test_generator.add_argument(
         "--same_address",
-        dest=ParameterIdentifier.SAME_ADDRESS.value,
+        dest=ParameterIdentifier.SAME_ADDRESS,
         metavar="BOOL",
         help="same address flag for burster flow",
     )
     test_generator.add_argument(
         "--restart",
-        dest=ParameterIdentifier.RESTART_ALGORITHM_AT_ITERATION.value,
+        dest=ParameterIdentifier.RESTART_ALGORITHM_AT_ITERATION,
         metavar="BOOL",
         help="restart algorithm flag",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.MARCH_ELEMENT.value}",
+        f"--{ParameterIdentifier.MARCH_ELEMENT}",
         metavar="<list>",
         default="up,wI,rI",
         help="list/lists separated by comma for march algorithm",
@@ -449,12 +449,12 @@ def _parse_args(argv: List[str]):
 
     """ Algorithm specific parameteres"""
     test_generator.add_argument(
-        f"--{ParameterIdentifier.NUMBER_BYTES_TO_REPEAT.value}",
+        f"--{ParameterIdentifier.NUMBER_BYTES_TO_REPEAT}",
         metavar="NUMBER",
         help="number bytes to repeat",
     )
     test_generator.add_argument(
-        f"--{ParameterIdentifier.PATTERN_LIST.value}",
+        f"--{ParameterIdentifier.PATTERN_LIST}",
         metavar="<list>",
         help="pattern list for pattern list algorithm",
     )
@@ -549,13 +549,13 @@ def check_memory_options(dictionary):
     CLI, since other parameters can be created directly, but memory parameters
     require additional validation."""
     if dictionary[BLOCKS_AMOUNT] not in [None, ""]:  # If using memory blocks
-        dictionary[ParameterIdentifier.MEMORY_BLOCK_AMOUNT.value] = dictionary[
+        dictionary[ParameterIdentifier.MEMORY_BLOCK_AMOUNT] = dictionary[
             BLOCKS_AMOUNT
         ]
-        dictionary[ParameterIdentifier.MEMORY_SIZE_IN_BYTES.value] = dictionary[
+        dictionary[ParameterIdentifier.MEMORY_SIZE_IN_BYTES] = dictionary[
             BLOCK_SIZE
         ]
-        dictionary[ParameterIdentifier.MEMORY_BLOCK_ALLOCATOR_TYPE.value] = (
+        dictionary[ParameterIdentifier.MEMORY_BLOCK_ALLOCATOR_TYPE] = (
             dictionary[ALLOCATOR]
         )
 
@@ -590,13 +590,13 @@ def check_memory_options(dictionary):
             )
 
     elif dictionary[MEM_USAGE] not in [None, ""]:  # If using memory groups
-        dictionary[ParameterIdentifier.MEMORY_GROUP_OVERALL.value] = dictionary[
+        dictionary[ParameterIdentifier.MEMORY_GROUP_OVERALL] = dictionary[
             MEM_USAGE
         ]
-        dictionary[ParameterIdentifier.MEMORY_GROUP_SIZE_IN_BYTES.value] = (
+        dictionary[ParameterIdentifier.MEMORY_GROUP_SIZE_IN_BYTES] = (
             dictionary[BLOCK_SIZE]
         )
-        dictionary[ParameterIdentifier.MEMORY_GROUP_BLOCK_TYPE.value] = (
+        dictionary[ParameterIdentifier.MEMORY_GROUP_BLOCK_TYPE] = (
             dictionary[ALLOCATOR]
         )
 
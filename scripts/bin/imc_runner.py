@@ -20,7 +20,7 @@ This module is a Python wrapper intended to call tools on multiple logical proce
 If the target LPUs are not specified then a thread is spawned for each LPU on the system.
 """
 import sys
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from scripts.libs.definitions.exit_codes import ExitCode
 from scripts.libs.components.factories.runnable_factory import RunnableFactory
 from scripts.libs.system_handler import SystemHandler
@@ -34,7 +34,14 @@ from scripts.libs.components.loggers.logger_manager import (
 )
 
 
-exit_code = None
+def _severity(exit_code):
+    """
+    Sort key used to reduce the exit codes of several runnables into one.
+
+    Any non-OK code outranks `ExitCode.OK`; among failures the highest
+    numeric value wins.
+    """
+    return (int(exit_code) != int(ExitCode.OK), int(exit_code))
 
 
 def create_runnable(tool, argv):
@@ -43,27 +50,27 @@ def create_runnable(tool, argv):
 
     This function uses the `RunnableFactory` to create a runnable object for the given tool
     and its arguments. It then sets up, executes, and performs post-execution cleanup for
-    the runnable. If an error occurs during setup or execution, it logs the error and exits
-    with a failure code.
+    the runnable. If an error occurs during setup or execution, it logs the error and
+    returns a failure code.
 
     Args:
         tool (str): The name of the tool to create a runnable for.
         argv (list): A list of arguments to pass to the tool.
 
-    Raises:
-        ValueError: If the tool creation or execution fails due to invalid arguments.
-        TypeError: If the tool creation or execution fails due to type mismatches.
+    Returns:
+        ExitCode | int: The exit code produced by the runnable, or
+        `ExitCode.RUNNER_TOOL_FAILED` if setup or execution raised a
+        `ValueError` or `TypeError`.
     """
-    global exit_code
     runnable = RunnableFactory().create(tool, argv)
     try:
         runnable.setup()
         exit_code = runnable.execute()
     except (ValueError, TypeError) as ex_err:
         LoggerManager().log("SYS", LoggerManagerThread.Level.ERROR, str(ex_err))
-        LoggerManagerThread().pretty_exit("SYS", ExitCode.RUNNER_TOOL_FAILED)
-        return ex_err
+        return ExitCode.RUNNER_TOOL_FAILED
     runnable.post()
+    return exit_code
 
 
 def main(argv: list) -> int:
@@ -73,7 +80,8 @@ def main(argv: list) -> int:
     This function initializes the `SystemHandler`, registers signal handlers, and creates
     threads for executing runnable objects for each tool specified in the system arguments.
     Each thread is responsible for executing a runnable object for a specific tool. The
-    function waits for all threads to complete before exiting.
+    function waits for all threads to complete and exits with the most severe exit code
+    returned by them.
 
     Args:
         argv (list): A list of command-line arguments passed to the script.
@@ -99,31 +107,39 @@ def main(argv: list) -> int:
     defaultSignalHandler()
     exit_code = ExitCode.OK
 
-    runnable_threads = []
-    for tool, args in SystemHandler().tools_args.items():
-        if tool == "SYS":
-            continue
-        runnable_thread = threading.Thread(
-            target=create_runnable,
-            args=(
-                tool,
-                args,
-            ),
-        )
+    tools = [
+        (tool, args)
+        for tool, args in SystemHandler().tools_args.items()
+        if tool != "SYS"
+    ]
+    futures = []
+    with ThreadPoolExecutor(max_workers=max(len(tools), 1)) as pool:
+        for tool, args in tools:
+            try:
+                futures.append(pool.submit(create_runnable, tool, args))
+            except Exception as ex_err:
+                LoggerManager().log(
+                    "SYS",
+                    LoggerManagerThread.Level.ERROR,
+                    f"Thread start error: {str(ex_err)}",
+                )
+                exit_code = ExitCode.RUNNER_TOOL_FAILED
+                break
+
+    results = [exit_code]
+    for future in futures:
+        # SystemExit from a tool's own pretty_exit is not an Exception and
+        # still propagates; anything else must not skip the final exit.
         try:
-            runnable_thread.start()
-            runnable_threads.append(runnable_thread)
+            results.append(future.result())
         except Exception as ex_err:
             LoggerManager().log(
                 "SYS",
                 LoggerManagerThread.Level.ERROR,
-                f"Thread start error: {str(ex_err)}",
+                f"Runnable error: {str(ex_err)}",
             )
-            exit_code = ExitCode.RUNNER_TOOL_FAILED
-            break
-
-    for runnable_thread in runnable_threads:
-        runnable_thread.join()
+            results.append(ExitCode.RUNNER_TOOL_FAILED)
+    exit_code = ExitCode(int(max(results, key=_severity)))
 
     LoggerManagerThread().pretty_exit("SYS", exit_code)
     return exit_code
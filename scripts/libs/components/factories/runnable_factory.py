@@ -20,10 +20,41 @@ interface. It uses a factory pattern to create runnable objects and assigns the
 necessary components dynamically using lazy loading.
 """
 
+import functools
+import threading
+
 from scripts.libs.runnables.imc_runnable import ImcRunnable
 from scripts.libs.utils.lazy_loader import LazyLoader
 from scripts.libs.tools.tool_managers.imc_tool_manager import ImcToolManager
 
+_load_lock = threading.Lock()
+
+# Executor implementations keyed by the `--execution` argument value. New
+# executors only need to be registered here.
+_EXECUTORS = {
+    "queue": (
+        "scripts.libs.components.task_executor.queue_executor",
+        "QueueExecutor",
+    ),
+    "batch": (
+        "scripts.libs.components.task_executor.batch_executor",
+        "BatchExecutor",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load(module_name, class_name):
+    """
+    Resolves a component class through `LazyLoader` only once per process.
+
+    Runnables are created from several threads at startup, so the first import
+    is serialized to keep them from racing through the import machinery; later
+    calls are served from the cache.
+    """
+    with _load_lock:
+        return LazyLoader.load(module_name, class_name)
+
 
 class RunnableFactory:
     """
@@ -70,25 +101,19 @@ class RunnableFactory:
         """
         if tool == "IMC":
             tool_manager = ImcToolManager(args_string)
+            parsed_args = tool_manager.tool_data.parsed_args
             runnable = ImcRunnable(tool_manager)
             # Assign the distribution dynamically using lazy loading
             # Pass the singleton instance directly for better performance
-            runnable.distribution = LazyLoader.load(
+            runnable.distribution = _load(
                 "scripts.libs.components.distributions.cycle_distribution",
                 "CycleDistribution",
             )(tool_manager)
 
             # Assign the executor dynamically based on the execution type
-            if tool_manager.tool_data.parsed_args.executionType == "queue":
-                runnable.executor = LazyLoader.load(
-                    "scripts.libs.components.task_executor.queue_executor",
-                    "QueueExecutor",
-                )(tool_manager)
-            elif tool_manager.tool_data.parsed_args.executionType == "batch":
-                runnable.executor = LazyLoader.load(
-                    "scripts.libs.components.task_executor.batch_executor",
-                    "BatchExecutor",
-                )(tool_manager)
+            executor = _EXECUTORS.get(parsed_args.executionType)
+            if executor is not None:
+                runnable.executor = _load(*executor)(tool_manager)
 
             return runnable
         else:
@@ -21,7 +21,7 @@ import queue
 import os
 import sys
 import time
-import copy
+import collections.abc
 from enum import IntEnum
 from datetime import datetime
 import re
@@ -29,6 +29,88 @@ from typing import Optional
 from scripts.libs.definitions.exit_codes import ExitCode
 from scripts.libs.utils.singleton_meta import SingletonMeta
 
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-9;]*[ -/]*[@-~])")
+# Console file descriptors on Windows expect the console code page, so the
+# raw descriptor write is only used on POSIX systems.
+_FD_WRITES = os.name == "posix"
+
+# Attributes shared by every record built by LoggerManagerThread.log; the
+# per-record fields are filled in by _make_record.
+_RECORD_TEMPLATE = logging.LogRecord(
+    "", logging.NOTSET, "", 0, "", None, None
+).__dict__.copy()
+
+
+def _make_record(name: str, level: int, msg: str, args: tuple):
+    """
+    Builds the LogRecord for a message without `Logger.makeRecord`.
+
+    The records carry no caller information, so the frame inspection and
+    the attribute setup done by `LogRecord.__init__` are skipped: the record
+    is created from a prebuilt template and only the fields that change
+    between messages are set.
+    """
+    if (
+        len(args) == 1
+        and isinstance(args[0], collections.abc.Mapping)
+        and args[0]
+    ):
+        args = args[0]
+    created = time.time()
+    thread = threading.current_thread()
+    record = logging.LogRecord.__new__(logging.LogRecord)
+    record.__dict__.update(
+        _RECORD_TEMPLATE,
+        name=name,
+        msg=msg,
+        args=args,
+        levelname=logging.getLevelName(level),
+        levelno=level,
+        created=created,
+        msecs=int((created - int(created)) * 1000) + 0.0,
+        relativeCreated=(created - logging._startTime) * 1000,
+        thread=thread.ident,
+        threadName=thread.name,
+    )
+    return record
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once
+
+    With a `datefmt` the timestamp has a resolution of one second, so the
+    string built for the last second is reused for every record logged
+    within it. Instances are only used by the logging thread and need no
+    locking.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(datefmt, self.converter(sec))
+            self._last_sec = sec
+        return self._last_str
+
+
+class NoColorFormatter(CachedTimeFormatter):
+    """Formatter that strips ANSI color codes from log messages"""
+
+    def format(self, record):
+        # Stripping the formatted line leaves the record untouched for other
+        # handlers, and most lines carry no color codes, so the substring test
+        # usually skips the regex.
+        formatted = super().format(record)
+        if "\x1b" in formatted:
+            return _ANSI_ESCAPE.sub("", formatted)
+        return formatted
+
 
 class LoggerManager(metaclass=SingletonMeta):
     """
@@ -36,6 +118,8 @@ class LoggerManager(metaclass=SingletonMeta):
     """
 
     PHASE_EXECUTION = "EXECUTION"
+    # Buffered EXECUTION records kept before they are flushed early
+    EXEC_BUFFER_LIMIT = 100000
 
     def __init__(self):
         self.manager_thread = LoggerManagerThread()
@@ -43,8 +127,9 @@ class LoggerManager(metaclass=SingletonMeta):
         self.preserve_loggers = []
 
         self.current_phase = None
-        self.thread_logs = {}
-        self.thread_order = []
+        self._exec_buffer = []
+        # Worker threads append to the buffer while any of them may flush it
+        self._exec_buffer_lock = threading.Lock()
 
     def create_logger(
         self,
@@ -69,15 +154,14 @@ class LoggerManager(metaclass=SingletonMeta):
         Args:
             name (str): The name of the logger
             level (int): The logging level for the message
-            msg (str): The log message
+            msg (str): The log message, %-formatted with `args` only when
+                a handler emits it
             thread_name (str, optional): The name of the thread generating the log
         """
-        formatted_msg = msg
-        if args:
-            try:
-                formatted_msg = msg % args
-            except Exception:
-                formatted_msg = msg
+        # Without thread/phase keywords a record can never be buffered
+        if not kwargs:
+            self.manager_thread.log(name, level, msg, *args)
+            return
 
         thread_name = kwargs.pop("thread_name", None)
 
@@ -87,21 +171,44 @@ class LoggerManager(metaclass=SingletonMeta):
             self.current_phase == self.PHASE_EXECUTION
             or phase == self.PHASE_EXECUTION
         ) and thread_name:
-            if thread_name not in self.thread_logs:
-                self.thread_logs[thread_name] = []
-                self.thread_order.append(thread_name)
-            self.thread_logs[thread_name].append(
-                (name, level, formatted_msg, kwargs)
-            )
+            # Records no handler would emit are not worth buffering
+            if not self.is_enabled_for(name, level):
+                return
+            with self._exec_buffer_lock:
+                self._exec_buffer.append(
+                    (thread_name, name, level, msg, args, kwargs)
+                )
+                is_full = len(self._exec_buffer) >= self.EXEC_BUFFER_LIMIT
+            if is_full:
+                self.flush_thread_logs()
             return
-        self.manager_thread.log(name, level, formatted_msg, **kwargs)
+        self.manager_thread.log(name, level, msg, *args, **kwargs)
+
+    def is_enabled_for(self, name: str, level: int) -> bool:
+        """
+        Checks whether a message at `level` would be emitted by a logger.
+
+        Callers can use it to skip building expensive log arguments.
+
+        Args:
+            name (str): The name of the logger
+            level (int): The logging level of the message
+
+        Returns:
+            bool: True if at least one handler of the logger accepts `level`
+        """
+        logger_data = self.manager_thread.loggers.get(name)
+        return (
+            logger_data is not None
+            and level >= logger_data["min_handler_level"]
+        )
 
     def set_preserve_loggers(self, logger_names):
         """
         Set loggers to preserve during stop_all operations.
 
         Args:
-            logger_names (list): List of logger names to preserve
+            logger_names (list or tuple): Names of the loggers to preserve
         """
         self.preserve_loggers = logger_names
 
@@ -154,34 +261,38 @@ class LoggerManager(metaclass=SingletonMeta):
     def flush_thread_logs(self):
         """
         Flush all buffered thread logs in an organized manner.
-        """
-        if not self.thread_logs:
-            return
 
-        self.manager_thread.log("SYS", LoggerManagerThread.Level.INFO, "")
-        self.manager_thread.log(
-            "SYS",
-            LoggerManagerThread.Level.INFO,
-            "===== THREAD EXECUTION LOGS =====",
-        )
-        self.manager_thread.log("SYS", LoggerManagerThread.Level.INFO, "")
+        Records are grouped by thread, with threads in the order they first
+        logged and each thread's records in the order they were produced.
+        The buffer lock is held until the records are queued, so concurrent
+        flushes do not interleave and appends wait for a fresh list.
+        """
+        with self._exec_buffer_lock:
+            buffer, self._exec_buffer = self._exec_buffer, []
+            if not buffer:
+                return
 
-        for thread_name in self.thread_order:
-            if thread_name not in self.thread_logs:
-                continue
+            first_seen = {}
+            for entry in buffer:
+                first_seen.setdefault(entry[0], len(first_seen))
+            buffer.sort(key=lambda entry: first_seen[entry[0]])
 
-            thread_separator = f"----- {thread_name} -----"
-            self.manager_thread.log(
-                "SYS", LoggerManagerThread.Level.INFO, thread_separator
-            )
+            log = self.manager_thread.log
+            info = LoggerManagerThread.Level.INFO
 
-            for name, level, msg, kwargs in self.thread_logs[thread_name]:
-                self.manager_thread.log(name, level, msg, **kwargs)
+            log("SYS", info, "")
+            log("SYS", info, "===== THREAD EXECUTION LOGS =====")
+            log("SYS", info, "")
 
-            self.manager_thread.log("SYS", LoggerManagerThread.Level.INFO, "")
-
-        self.thread_logs = {}
-        self.thread_order = []
+            current_thread = None
+            for thread_name, name, level, msg, args, kwargs in buffer:
+                if thread_name != current_thread:
+                    if current_thread is not None:
+                        log("SYS", info, "")
+                    current_thread = thread_name
+                    log("SYS", info, f"----- {thread_name} -----")
+                log(name, level, msg, *args, **kwargs)
+            log("SYS", info, "")
 
 
 class LoggerManagerThread(threading.Thread):
@@ -193,11 +304,11 @@ class LoggerManagerThread(threading.Thread):
     does not block the main application
 
     Attributes:
-        name (str): The name of the logger.
-        log_level (Level): The logging level
-        log_format (logging.Formatter): The format for log messages
-        queue (queue.Queue): A queue for storing log messages
-        _logger (logging.Logger): The logger instance
+        loggers (dict): The registered loggers, keyed by name.
+        lock (threading.Lock): Guards changes to `loggers`.
+        _inbox (queue.SimpleQueue): Pending `(logger, record)` pairs shared
+            by every producer thread and drained by this thread. `None`
+            entries only wake the thread up.
     """
 
     class Level(IntEnum):
@@ -224,6 +335,8 @@ class LoggerManagerThread(threading.Thread):
         super().__init__()
         self.loggers = {}
         self.lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._inbox = queue.SimpleQueue()
         self._running = True
         self.daemon = True
         """
@@ -252,13 +365,41 @@ class LoggerManagerThread(threading.Thread):
         """
         with self.lock:
             if name not in self.loggers:
-                queue_ = queue.Queue()
                 logger = self._setup_logger(name, log_level, log_format)
                 self.loggers[name] = {
-                    "queue": queue_,
                     "logger": logger,
+                    "min_handler_level": self._min_handler_level(logger),
+                    "level": self._common_handler_level(logger),
+                    "level_filters": [
+                        filter_obj
+                        for handler in logger.handlers
+                        for filter_obj in handler.filters
+                        if hasattr(filter_obj, "min_level")
+                    ],
                 }
 
+    def _min_handler_level(self, logger: logging.Logger) -> int:
+        """
+        Returns the lowest level any handler of `logger` will emit.
+
+        Records below this level would be dropped by every handler, so they
+        are discarded before a LogRecord is built for them. A logger without
+        handlers (`Level.OFF`) emits nothing.
+        """
+        return min(
+            (handler.level for handler in logger.handlers),
+            default=self.Level.OFF,
+        )
+
+    @staticmethod
+    def _common_handler_level(logger: logging.Logger) -> Optional[int]:
+        """
+        Returns the level shared by every handler of `logger`, or None when
+        the logger has no handlers or they are set to different levels.
+        """
+        levels = {handler.level for handler in logger.handlers}
+        return levels.pop() if len(levels) == 1 else None
+
     def _setup_logger(
         self,
         name: str,
@@ -277,10 +418,14 @@ class LoggerManagerThread(threading.Thread):
         )
 
         logger.setLevel(self.Level.DEBUG)
-        for handler in logger.handlers:
-            logger.removeHandler(handler)
-
-        formatter = log_format or logging.Formatter(
+        # Removing handlers while iterating over logger.handlers skips every
+        # other one; detach them all at once instead. Called under self.lock.
+        old_handlers = logger.handlers[:]
+        logger.handlers.clear()
+        for handler in old_handlers:
+            handler.close()
+
+        formatter = log_format or CachedTimeFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             "%Y-%m-%d %H:%M:%S",
         )
@@ -323,19 +468,6 @@ class LoggerManagerThread(threading.Thread):
                 file_handler = logging.FileHandler(log_file)
                 file_handler.setLevel(self.Level.DEBUG)
 
-                class NoColorFormatter(logging.Formatter):
-                    """Formatter that strips ANSI color codes from log messages"""
-
-                    ansi_escape = re.compile(
-                        r"\x1B(?:[@-Z\\-_]|\[[0-9;]*[ -/]*[@-~])"
-                    )
-
-                    def format(self, record):
-                        if isinstance(record.msg, str):
-                            record = copy.copy(record)
-                            record.msg = self.ansi_escape.sub("", record.msg)
-                        return super().format(record)
-
                 file_formatter = NoColorFormatter(
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
                     "%Y-%m-%d %H:%M:%S",
@@ -355,49 +487,151 @@ class LoggerManagerThread(threading.Thread):
             *args: Additional arguments for the log message.
             **kwargs: Additional keyword arguments for the log message.
         """
-        with self.lock:
-            if name in self.loggers:
-                record = self.loggers[name]["logger"].makeRecord(
-                    name,
-                    level,
-                    fn="",
-                    lno=0,
-                    msg=msg,
-                    args=args,
-                    exc_info=None,
-                    func=None,
-                    extra=None,
-                )
-                self.loggers[name]["queue"].put(record)
+        # SimpleQueue.put is implemented in C and never blocks, so producers
+        # take no Python-level lock here; the dictionary read is safe because
+        # loggers are only added or removed under `self.lock`.
+        logger_data = self.loggers.get(name)
+        if (
+            logger_data is not None
+            and level >= logger_data["min_handler_level"]
+        ):
+            self._inbox.put(
+                (logger_data["logger"], _make_record(name, level, msg, args))
+            )
 
     def run(self):
+        inbox = self._inbox
         while self._running:
-            self._process_log_queue()
-            time.sleep(0.01)
+            self._process_log_queue(pending=inbox.get())
 
         self._process_log_queue(flush_all=True)
 
-    def _process_log_queue(self, flush_all=False):
+    def _process_log_queue(self, flush_all=False, pending=None):
         """
         Process pending log messages in the queue.
 
         Args:
             flush_all (bool): If True, will try to flush all logs even from empty queues
-        """
-        with self.lock:
-            for logger_data in self.loggers.values():
-                while True:
-                    try:
-                        record = logger_data["queue"].get_nowait()
-                        logger_data["logger"].handle(record)
-                    except queue.Empty:
-                        break
-
-                if flush_all and logger_data["logger"].handlers:
+            pending (tuple, optional): An entry already taken from the queue
+                that must be processed first.
+        """
+        # Every record passes through this loop, so lookups are bound to
+        # locals and filter calls are skipped for loggers without filters.
+        get_nowait = self._inbox.get_nowait
+        with self._drain_lock:
+            batches = {}
+            item = pending
+            while True:
+                if item is not None:
+                    logger, record = item
+                    if not logger.disabled and (
+                        not logger.filters or logger.filter(record)
+                    ):
+                        levelno = record.levelno
+                        for handler in logger.handlers:
+                            if levelno >= handler.level:
+                                batch = batches.get(handler)
+                                if batch is None:
+                                    batches[handler] = [record]
+                                else:
+                                    batch.append(record)
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+
+            for handler, records in batches.items():
+                self._emit_batch(handler, records)
+
+            if flush_all:
+                # Only the snapshot is taken under the lock; a slow flush
+                # must not hold up add_logger or stop_logger.
+                with self.lock:
+                    snapshot = list(self.loggers.values())
+                for logger_data in snapshot:
                     for handler in logger_data["logger"].handlers:
                         if hasattr(handler, "flush"):
                             handler.flush()
 
+    @staticmethod
+    def _emit_batch(handler: logging.Handler, records: list):
+        """
+        Emits the records drained for a handler in one drain cycle.
+
+        Stream handlers receive every formatted line in a single write, instead
+        of a write and flush per record. Any other handler type is fed record
+        by record through its regular `handle`.
+
+        Args:
+            handler (logging.Handler): The handler to emit to.
+            records (list): The records routed to `handler`, in order.
+        """
+        stream = getattr(handler, "stream", None)
+        if not isinstance(handler, logging.StreamHandler) or stream is None:
+            for record in records:
+                handler.handle(record)
+            return
+
+        lines = []
+        append = lines.append
+        fmt = handler.format
+        check = handler.filter if handler.filters else None
+        for record in records:
+            if check is None or check(record):
+                try:
+                    try:
+                        append(fmt(record))
+                    except (TypeError, ValueError):
+                        # Arguments are formatted lazily here; a message that
+                        # does not match them is still logged verbatim.
+                        record.args = ()
+                        append(fmt(record))
+                except Exception:
+                    handler.handleError(record)
+        if not lines:
+            return
+
+        # Handlers are only emitted to under `_drain_lock`, so the handler
+        # lock is not needed for the write.
+        terminator = handler.terminator
+        try:
+            LoggerManagerThread._write(
+                stream, terminator.join(lines) + terminator
+            )
+        except Exception:
+            handler.handleError(records[-1])
+
+    @staticmethod
+    def _write(stream, text: str):
+        """
+        Writes `text` to `stream` and makes sure it reaches the file.
+
+        Streams backed by a file descriptor are written with `os.write`,
+        skipping the text and buffer layers of the stream. Anything already
+        buffered in the stream is flushed first to keep output in order.
+        Other streams, such as in-memory ones, get a plain write and flush.
+
+        Args:
+            stream: The stream of a `logging.StreamHandler`.
+            text (str): The formatted lines to write.
+        """
+        fd = None
+        if _FD_WRITES:
+            try:
+                fd = stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                fd = None
+        if fd is None:
+            stream.write(text)
+            stream.flush()
+            return
+
+        stream.flush()
+        encoding = getattr(stream, "encoding", None) or "utf-8"
+        data = memoryview(text.encode(encoding, "replace"))
+        while data:
+            data = data[os.write(fd, data) :]
+
     class StdoutFilter(logging.Filter):
         """
         A simple logging filter for stdout.
@@ -448,9 +682,9 @@ class LoggerManagerThread(threading.Thread):
             log_level (Level, optional): The logging level
             log_format (logging.Formatter, optional): The format for log messages
         """
-        with self.lock:
-            if name not in self.loggers:
-                self.add_logger(name, log_level, log_format)
+        # add_logger takes the lock and skips names that are already
+        # registered; taking it here as well would deadlock.
+        self.add_logger(name, log_level, log_format)
 
     def update_logger_level(self, name: str, log_level: int):
         """
@@ -460,21 +694,25 @@ class LoggerManagerThread(threading.Thread):
             name (str): The name of the logger.
             log_level (int): The new logging level.
         """
+        # Repeated calls with the current level are the common case and are
+        # answered without taking the lock.
+        logger_data = self.loggers.get(name)
+        if logger_data is None or logger_data["level"] == log_level:
+            return
+
         with self.lock:
-            if name in self.loggers:
-                logger = self.loggers[name]["logger"]
-                if logger.handlers and all(
-                    handler.level == log_level for handler in logger.handlers
-                ):
-                    return
+            logger_data = self.loggers.get(name)
+            if logger_data is None or logger_data["level"] == log_level:
+                return
 
-                for handler in logger.handlers:
-                    if handler.level != log_level:
-                        handler.setLevel(log_level)
+            logger = logger_data["logger"]
+            for handler in logger.handlers:
+                handler.setLevel(log_level)
+            for filter_obj in logger_data["level_filters"]:
+                filter_obj.min_level = log_level
 
-                        for filter_obj in handler.filters:
-                            if hasattr(filter_obj, "min_level"):
-                                filter_obj.min_level = log_level
+            logger_data["min_handler_level"] = self._min_handler_level(logger)
+            logger_data["level"] = log_level
 
     def has_logger(self, name: str) -> bool:
         """
@@ -486,8 +724,7 @@ class LoggerManagerThread(threading.Thread):
         Returns:
             bool: True if logger exists, False otherwise
         """
-        with self.lock:
-            return name in self.loggers
+        return name in self.loggers
 
     def stop(self):
         """
@@ -497,9 +734,11 @@ class LoggerManagerThread(threading.Thread):
         to stop processing log messages and ensures all pending logs are flushed.
         """
         self._running = False
+        self._inbox.put(None)
         self._process_log_queue(flush_all=True)
 
-        time.sleep(0.1)
+        if self.is_alive() and self is not threading.current_thread():
+            self.join(timeout=0.1)
 
     @classmethod
     def pretty_exit(cls, logger_name: str, exit_code: ExitCode):
@@ -516,7 +755,7 @@ class LoggerManagerThread(threading.Thread):
             ```
         """
         exit_str = f"EXIT_CODE: {exit_code} ({int(exit_code)})"
-        log_manager = LoggerManager()
+        log_manager = logger_manager
 
         if exit_code == ExitCode.OK:
             log_manager.log(logger_name, cls.Level.INFO, exit_str)
@@ -530,3 +769,9 @@ class LoggerManagerThread(threading.Thread):
 
         log_manager.stop_all()
         sys.exit(int(exit_code))
+
+
+# The one LoggerManager instance, bound once so that call sites can skip the
+# metaclass lookup behind `LoggerManager()`. Both names refer to the same
+# object.
+logger_manager = LoggerManager()
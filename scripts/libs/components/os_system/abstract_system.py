@@ -45,6 +45,7 @@ class AbstractSystem(ABC):
         set_priority(value): Converts a priority value to a 'nice' value (abstract).
         generate_os_command(test_case, mem_per_instance, lpu): Generates an OS-specific command (abstract).
         stop_thread(curr_thread): Stops a thread in an OS-specific way (abstract).
+        stop_threads(threads): Stops several threads in an OS-specific way.
     """
 
     @property
@@ -188,3 +189,23 @@ class AbstractSystem(ABC):
             NotImplementedError: If the method is not implemented in a subclass.
         """
         pass
+
+    def stop_threads(self, threads):
+        """
+        Stops several threads in an OS-specific way.
+
+        The default implementation calls `stop_thread` for each thread. Systems
+        that can terminate several processes at once should override it.
+
+        Args:
+            threads (list): The threads to stop.
+
+        Returns:
+            list: The non-empty results returned by `stop_thread`.
+        """
+        results = []
+        for curr_thread in threads:
+            result = self.stop_thread(curr_thread)
+            if result:
+                results.append(result)
+        return results
@@ -27,7 +27,7 @@ import os
 import signal
 from scripts.libs.components.os_system.abstract_system import AbstractSystem
 from scripts.libs.components.loggers.logger_manager import (
-    LoggerManager,
+    logger_manager,
     LoggerManagerThread,
 )
 
@@ -134,11 +134,16 @@ class LinuxSystem(AbstractSystem):
             str(lpu),
         ]
         _cmd.extend(command)
-        LoggerManager().log(
-            "SYS",
-            LoggerManagerThread.Level.DEBUG,
-            f"Generated OS command: {' '.join(_cmd)}",
-        )
+        # Runs once per test case; only join the command when it is logged
+        if logger_manager.is_enabled_for(
+            "SYS", LoggerManagerThread.Level.DEBUG
+        ):
+            logger_manager.log(
+                "SYS",
+                LoggerManagerThread.Level.DEBUG,
+                "Generated OS command: %s",
+                " ".join(_cmd),
+            )
 
         return _cmd
 
@@ -162,7 +167,7 @@ class LinuxSystem(AbstractSystem):
             ```
         """
         self.safe_kill(curr_thread, signal.SIGKILL)
-        LoggerManager().log(
+        logger_manager.log(
             "SYS",
             LoggerManagerThread.Level.DEBUG,
             f"Sending SIGKILL to {curr_thread.name} since it failed to stop when requested.",
@@ -24,6 +24,7 @@ Windows-specific implementations for handling processes, setting priorities,
 and generating commands.
 """
 
+import re
 import signal
 import threading
 import subprocess
@@ -31,11 +32,33 @@ import collections
 from scripts.libs.components.os_system.abstract_system import AbstractSystem
 from scripts.libs.utils.cpu_id import CPUID
 from scripts.libs.components.loggers.logger_manager import (
-    LoggerManager,
+    logger_manager,
     LoggerManagerThread,
 )
 from scripts.libs.system_handler import SystemHandler
 
+_DEBUG = LoggerManagerThread.Level.DEBUG
+_WARNING = LoggerManagerThread.Level.WARNING
+
+# Seconds to wait for taskkill before giving up on it
+_TASKKILL_TIMEOUT = 60
+
+# First PID on each taskkill success line, which is the process it ended
+_TASKKILL_SUCCESS = re.compile(r"^SUCCESS:.*?PID (\d+)", re.MULTILINE)
+
+TaskkillResult = collections.namedtuple(
+    "TaskkillResult", "taskkill_pid pid stdout stderr exitcode"
+)
+
+# `start` priority flags, indexed by (priority - 1) // 20 for 1-100
+_PRIORITIES = (
+    "/LOW",
+    "/BELOWNORMAL",
+    "/NORMAL",
+    "/ABOVENORMAL",
+    "/HIGH",
+)
+
 
 class WindowsSystem(AbstractSystem):
     """
@@ -115,31 +138,73 @@ class WindowsSystem(AbstractSystem):
             print(result.stdout)
             ```
         """
-        taskkill_cmd = "cmd /c taskkill /PID %d /T /F" % thread_obj.pid
-        proc = subprocess.Popen(
+        return self.safe_taskkill_many([thread_obj])[0]
+
+    def safe_taskkill_many(self, thread_objs: list):
+        """
+        Safely terminates several processes with a single `taskkill` call.
+
+        `taskkill.exe` is invoked directly, without a `cmd /c` wrapper, and
+        receives one `/PID` argument per process. If it does not finish within
+        `_TASKKILL_TIMEOUT` seconds it is killed and its exit code is `None`.
+
+        Args:
+            thread_objs (list): The thread objects representing the processes
+                to terminate.
+
+        Returns:
+            list: One `TaskkillResult` per thread, in the same order. When
+            `taskkill` fails for part of the batch, each PID reported on a
+            `SUCCESS:` line gets exit code 0 and the rest keep the exit code
+            of the call.
+
+        Example:
+            ```
+            windows_system = WindowsSystem()
+            results = windows_system.safe_taskkill_many(threads)
+            ```
+        """
+        pids = [thread_obj.pid for thread_obj in thread_objs]
+        taskkill_cmd = ["taskkill"]
+        for pid in pids:
+            taskkill_cmd.extend(["/PID", str(pid)])
+        taskkill_cmd.extend(["/T", "/F"])
+
+        with subprocess.Popen(
             taskkill_cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             shell=False,
             encoding="utf-8",
-        )  # nosec
-        (stdout, stderr) = proc.communicate()
-        taskkill_result = collections.namedtuple(
-            "TaskkillResult", "taskkill_pid pid stdout stderr exitcode"
-        )
-
-        LoggerManager().log(
+        ) as proc:  # nosec
+            try:
+                (stdout, stderr) = proc.communicate(timeout=_TASKKILL_TIMEOUT)
+                exitcode = proc.returncode
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                (stdout, stderr) = proc.communicate()
+                exitcode = None
+
+        logger_manager.log(
             "SYS",
-            LoggerManagerThread.Level.DEBUG,
-            f"Taskkill command executed for PID {thread_obj.pid}. Exit code: {proc.returncode}",
-        )
-        return taskkill_result(
-            taskkill_pid=proc.pid,
-            pid=thread_obj.pid,
-            stdout=stdout,
-            stderr=stderr,
-            exitcode=proc.returncode,
+            _DEBUG,
+            f"Taskkill command executed for PID(s) {', '.join(map(str, pids))}. Exit code: {exitcode}",
         )
+        killed_pids = set()
+        if exitcode not in (0, None):
+            killed_pids = {
+                int(pid) for pid in _TASKKILL_SUCCESS.findall(stdout or "")
+            }
+        return [
+            TaskkillResult(
+                taskkill_pid=proc.pid,
+                pid=pid,
+                stdout=stdout,
+                stderr=stderr,
+                exitcode=0 if pid in killed_pids else exitcode,
+            )
+            for pid in pids
+        ]
 
     def stop_thread(self, curr_thread):
         """
@@ -160,13 +225,31 @@ class WindowsSystem(AbstractSystem):
             windows_system.stop_thread(thread)
             ```
         """
-        LoggerManager().log(
+        logger_manager.log(
             "SYS",
-            LoggerManagerThread.Level.WARNING,
+            _WARNING,
             f"Using TASKKILL to end {curr_thread.name} since it failed to stop when requested.",
         )
         return self.safe_taskkill(curr_thread)
 
+    def stop_threads(self, threads):
+        """
+        Stops several threads with a single Windows `taskkill` command.
+
+        Args:
+            threads (list): The threads to stop.
+
+        Returns:
+            list: One `TaskkillResult` per thread.
+        """
+        for curr_thread in threads:
+            logger_manager.log(
+                "SYS",
+                _WARNING,
+                f"Using TASKKILL to end {curr_thread.name} since it failed to stop when requested.",
+            )
+        return self.safe_taskkill_many(threads)
+
     @staticmethod
     def set_priority(value: int):
         """
@@ -187,15 +270,8 @@ class WindowsSystem(AbstractSystem):
             print(priority_flag)  # Output: ['/NORMAL']
             ```
         """
-        start_priorities = [
-            "/LOW",
-            "/BELOWNORMAL",
-            "/NORMAL",
-            "/ABOVENORMAL",
-            "/HIGH",
-        ]
-        priority_val = int(abs(value - 1) / 20)
-        return [start_priorities[priority_val]]
+        priority_val = min(4, max(0, (value - 1) // 20))
+        return [_PRIORITIES[priority_val]]
 
     def generate_os_command(self, lpu: int, priority: int, command: list):
         """
@@ -203,7 +279,8 @@ class WindowsSystem(AbstractSystem):
 
         This method creates a command that sets the process priority, binds the
         process to a specific logical processing unit (LPU), and appends the
-        provided command.
+        provided command. `start /wait` runs the tool in the same `cmd`
+        process and leaves the tool's exit code as the exit code of `cmd`.
 
         Args:
             lpu (int): The logical processing unit (LPU) to bind the process to.
@@ -218,17 +295,17 @@ class WindowsSystem(AbstractSystem):
             windows_system = WindowsSystem()
             os_command = windows_system.generate_os_command(2, 50, ["python", "script.py"])
             print(os_command)
-            # Output: ['cmd', '/c', 'start', '/wait', '/b', '/NORMAL', '/AFFINITY', '0x4', 'python', 'script.py', '&&', 'exit', '$LASTEXITCODE']
+            # Output: ['cmd', '/c', 'start', '/wait', '/b', '/NORMAL', '/AFFINITY', '0x4', 'python', 'script.py']
             ```
         """
-        _cmd = [
+        return [
             "cmd",
             "/c",
             "start",
             "/wait",
             "/b",
-        ] + self.set_priority(priority)
-        _cmd.extend(["/AFFINITY", str(hex(0x1 << lpu))])
-        _cmd.extend(command)
-        _cmd.extend(["&&", "exit", "$LASTEXITCODE"])
-        return _cmd
+            *self.set_priority(priority),
+            "/AFFINITY",
+            f"0x{1 << lpu:x}",
+            *command,
+        ]
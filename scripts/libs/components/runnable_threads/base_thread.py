@@ -28,8 +28,12 @@ from scripts.libs.components.os_system.abstract_system import AbstractSystem
 from scripts.libs.components.loggers.logger_manager import (
     LoggerManager,
     LoggerManagerThread,
+    logger_manager,
 )
 
+# Result of one tool instance, put on the data queue by the workers
+TestResult = collections.namedtuple("TestResult", "pid stdout stderr exitcode")
+
 
 class BaseThread(threading.Thread):
     """
@@ -40,6 +44,8 @@ class BaseThread(threading.Thread):
     subprocess execution.
     Attributes:
         proc (subprocess.Popen): The subprocess object managed by the thread.
+        pid (int): The PID of the subprocess most recently started by the
+            thread, or None before the first one starts.
     """
 
     def __init__(self):
@@ -55,6 +61,7 @@ class BaseThread(threading.Thread):
         """
         super().__init__()
         self.proc = None
+        self.pid = None
 
     @classmethod
     def _pipe_reader(cls, pipe, logger_name, log_level) -> str:
@@ -75,17 +82,20 @@ class BaseThread(threading.Thread):
             print(stdout_data)
             ```
         """
-        ignore_lines = ["debug", "info"]
-        read_data = ""
+        # Lines are collected and joined once; growing one string line by
+        # line reallocates and copies the whole output over and over.
+        read_data = []
         try:
             with pipe:
                 thread_name = threading.current_thread().name
-                logger_manager = LoggerManager()
-                for line in iter(pipe.readline, ""):
-                    if any(bad_str in line for bad_str in ignore_lines):
+                log = logger_manager.log
+                # Iterating the pipe reads each line in C; lines containing
+                # "debug" or "info" are skipped.
+                for line in pipe:
+                    if "debug" in line or "info" in line:
                         continue
-                    read_data += line
-                    logger_manager.log(
+                    read_data.append(line)
+                    log(
                         "SYS",
                         log_level,
                         line.rstrip(),
@@ -95,7 +105,7 @@ class BaseThread(threading.Thread):
         except ValueError:
             # Pipe is closed
             pass
-        return read_data
+        return "".join(read_data)
 
     def create_subprocess(
         self,
@@ -131,9 +141,6 @@ class BaseThread(threading.Thread):
             ```
         """
         creation_flags = os_system.creation_flags
-        test_result = collections.namedtuple(
-            "TestResult", "pid stdout stderr exitcode"
-        )
         try:
             self.proc = subprocess.Popen(
                 exec_list,
@@ -141,25 +148,48 @@ class BaseThread(threading.Thread):
                 stderr=subprocess.PIPE,
                 shell=False,
                 encoding="utf-8",
+                # A stray invalid byte must not stop the readers: the
+                # decode error would look like a closed pipe and leave the
+                # instance blocked on a full pipe.
+                errors="replace",
                 creationflags=creation_flags,
             )
-            LoggerManager().log(
-                "SYS",
-                LoggerManagerThread.Level.DEBUG,
-                f"_run_cmd(): PID-{self.proc.pid} about to start using {' '.join(exec_list)}",
-                thread_name=self.name,
-                phase="EXECUTION",
-            )
+            if logger_manager.is_enabled_for(
+                "SYS", LoggerManagerThread.Level.DEBUG
+            ):
+                logger_manager.log(
+                    "SYS",
+                    LoggerManagerThread.Level.DEBUG,
+                    f"_run_cmd(): PID-{self.proc.pid} about to start using {' '.join(exec_list)}",
+                    thread_name=self.name,
+                    phase="EXECUTION",
+                )
+            self.pid = self.proc.pid
             pid_queue.put(self.proc.pid)  # Notify the parent process of the PID
+            # stderr is drained on a helper thread while this thread reads
+            # stdout; reading them one after the other would stall a child
+            # that fills the stderr pipe first. The helper shares this
+            # thread's name so its lines are grouped with the instance.
+            stderr_data = []
+            stderr_reader = threading.Thread(
+                target=lambda pipe: stderr_data.append(
+                    self._pipe_reader(
+                        pipe, "SYS", LoggerManagerThread.Level.ERROR
+                    )
+                ),
+                args=(self.proc.stderr,),
+                name=self.name,
+                daemon=True,
+            )
+            stderr_reader.start()
             stdout = self._pipe_reader(
                 self.proc.stdout, "SYS", LoggerManagerThread.Level.INFO
             )
-            stderr = self._pipe_reader(
-                self.proc.stderr, "SYS", LoggerManagerThread.Level.ERROR
-            )
+            stderr_reader.join()
+            stderr = stderr_data[0] if stderr_data else ""
             self.proc.wait()
             data_queue.put(
-                test_result(
+                TestResult(
                     pid=self.proc.pid,
                     stdout=stdout,
                     stderr=stderr,
@@ -25,6 +25,7 @@ execution until the queue is empty.
 """
 
 import queue
+import collections
 from scripts.libs.components.os_system.abstract_system import AbstractSystem
 from scripts.libs.components.runnable_threads.base_thread import BaseThread
 from scripts.libs.components.loggers.logger_manager import (
@@ -42,7 +43,8 @@ class QueueThread(BaseThread):
     thread continues execution until the queue is empty.
 
     Attributes:
-        exec_queue (queue.Queue): A queue containing the commands to execute.
+        exec_queue (collections.deque): The commands to execute, shared by
+            all workers.
         data_queue (queue.Queue): A queue to store the results of the subprocesses.
         pid_queue (queue.Queue): A queue to store the PIDs of the subprocesses.
         os_system (AbstractSystem): The operating system abstraction for managing
@@ -52,7 +54,7 @@ class QueueThread(BaseThread):
 
     def __init__(
         self,
-        exec_queue: queue.Queue,
+        exec_queue: collections.deque,
         data_queue: queue.Queue,
         pid_queue: queue.Queue,
         os_system: AbstractSystem,
@@ -64,7 +66,8 @@ class QueueThread(BaseThread):
         for managing subprocess execution and communication.
 
         Args:
-            exec_queue (queue.Queue): A queue containing the commands to execute.
+            exec_queue (collections.deque): The commands to execute, shared by
+                all workers.
             data_queue (queue.Queue): A queue to store the results of the subprocesses.
             pid_queue (queue.Queue): A queue to store the PIDs of the subprocesses.
             os_system (AbstractSystem): The operating system abstraction for managing
@@ -73,7 +76,7 @@ class QueueThread(BaseThread):
 
         Example:
             ```
-            exec_queue = queue.Queue()
+            exec_queue = collections.deque(commands)
             data_queue = queue.Queue()
             pid_queue = queue.Queue()
             os_system = AbstractSystem()
@@ -104,8 +107,13 @@ class QueueThread(BaseThread):
             ```
         """
 
-        while not self.exec_queue.empty():
-            exec_list = self.exec_queue.get(block=False)
+        while True:
+            # popleft() is atomic, so workers share the deque without a lock;
+            # checking for emptiness first would race with the other workers.
+            try:
+                exec_list = self.exec_queue.popleft()
+            except IndexError:
+                break
             self.create_subprocess(
                 exec_list,
                 self.data_queue,
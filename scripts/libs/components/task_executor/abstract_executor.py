@@ -36,6 +36,10 @@ from scripts.libs.components.loggers.logger_manager import (
 )
 from scripts.libs.components.os_system.abstract_system import AbstractSystem
 
+# Seconds watch_threads waits for a result before re-checking the workers
+# and the timeout
+_RESULT_WAIT = 0.1
+
 
 class AbstractExecutor(ABC):
     """
@@ -76,8 +80,10 @@ class AbstractExecutor(ABC):
             self.signalMap[signal.SIGTSTP] = self.halt_threads
             self.signalMap[signal.SIGCONT] = self.resume_threads
         self.threads = []
-        self.tool_manager.tool_data.data["result_queue"] = queue.Queue()
-        self.tool_manager.tool_data.data["pid_queue"] = queue.Queue()
+        # Neither channel needs task_done()/join(), so the C-implemented
+        # SimpleQueue is used in place of queue.Queue.
+        self.tool_manager.tool_data.data["result_queue"] = queue.SimpleQueue()
+        self.tool_manager.tool_data.data["pid_queue"] = queue.SimpleQueue()
         self.tool_manager.tool_data.data["data_from_queue"] = []
         self.tool_manager.tool_data.data["taskkill_result_list"] = []
 
@@ -106,33 +112,42 @@ class AbstractExecutor(ABC):
 
         thread_count = len(self.threads)
 
+        # Looked up once; the loop below runs until every instance ends
+        tool_data = self.tool_manager.tool_data
+        parsed_args = tool_data.parsed_args
+        data = tool_data.data
+        result_queue = data["result_queue"]
+        taskkill_results = data["taskkill_result_list"]
+        data_from_queue = data["data_from_queue"]
+        timeout = parsed_args.timeout
+        is_windows = (
+            SystemHandler().os_system.platform_name.upper() == "WINDOWS"
+        )
+
         timeout_msg = None
-        if self.tool_manager.tool_data.parsed_args.timeout:
+        if timeout:
             timeout_msg = (
                 "The timeout period of %s minute(s) has been reached, stopping all %s instances."
                 % (
-                    self.tool_manager.tool_data.parsed_args.timeout,
-                    self.tool_manager.tool_data.TOOL_NAME,
+                    timeout,
+                    tool_data.TOOL_NAME,
                 )
             )
 
         while True:
-            if thread_count > 0 and not any(x.is_alive() for x in self.threads):
-                break
+            # Checked before the queue is drained: a worker puts its result
+            # before it ends, so nothing can be left behind once the final
+            # drain below is done.
+            threads_done = thread_count > 0 and not any(
+                x.is_alive() for x in self.threads
+            )
 
-            if (
-                thread_count == 0
-                and self.tool_manager.tool_data.data["result_queue"].empty()
-            ):
+            if thread_count == 0 and result_queue.empty():
                 break
 
-            if (
-                not timed_out
-                and self.tool_manager.tool_data.parsed_args.timeout
-                and time.time() >= end_time
-            ):
+            if not timed_out and timeout and time.time() >= end_time:
                 timed_out = True
-                self.tool_manager.tool_data.data["time_limit_reached"] = True
+                data["time_limit_reached"] = True
 
                 LoggerManager().log(
                     "SYS", LoggerManagerThread.Level.INFO, timeout_msg
@@ -143,67 +158,60 @@ class AbstractExecutor(ABC):
                 logger = getattr(self.tool_manager, "logger", None)
                 if logger and hasattr(logger, "log_timeout"):
                     logger.log_timeout(
-                        self.tool_manager.tool_data.parsed_args.timeout,
+                        timeout,
                         unit="minute(s)",
                     )
                 self.stop_threads()
 
-            queue_emptied = False
-            while not queue_emptied:
+            # While instances are running, block briefly for the next result
+            # instead of spinning; whatever else is queued is then taken
+            # without waiting.
+            wait = not threads_done
+            while True:
                 try:
-                    if not self.tool_manager.tool_data.data[
-                        "result_queue"
-                    ].empty():
-                        current_data = self.tool_manager.tool_data.data[
-                            "result_queue"
-                        ].get(block=False)
-
-                        if (
-                            SystemHandler().os_system.platform_name.upper()
-                            == "WINDOWS"
-                        ):
-                            for (
-                                taskkill_result
-                            ) in self.tool_manager.tool_data.data[
-                                "taskkill_result_list"
-                            ]:
-                                if (
-                                    taskkill_result.exitcode == 0
-                                    and current_data.pid == taskkill_result.pid
-                                ):
-                                    current_data = current_data._replace(
-                                        exitcode=ExitCode.TOOL_ENDED_USING_TASKKILL
-                                    )
-                                    break
-                        thread_name = f"Thread-PID-{current_data.pid}"
-                        LoggerManager().log(
-                            "SYS",
-                            LoggerManagerThread.Level.DEBUG,
-                            "New data in the finished queue from PID-%d"
-                            % current_data.pid,
-                            thread_name=thread_name,
-                        )
+                    current_data = result_queue.get(
+                        block=wait, timeout=_RESULT_WAIT if wait else None
+                    )
+                except queue.Empty:
+                    break
+                wait = False
 
+                if is_windows:
+                    for taskkill_result in taskkill_results:
                         if (
-                            self.tool_manager.tool_data.parsed_args.stop_on_error
-                            and current_data.exitcode != int(ExitCode.OK)
+                            taskkill_result.exitcode == 0
+                            and current_data.pid == taskkill_result.pid
                         ):
-                            LoggerManager().log(
-                                "SYS",
-                                LoggerManagerThread.Level.ERROR,
-                                "Instance PID-%d has ended prematurely!"
-                                % current_data.pid,
-                                thread_name=f"Thread-PID-{current_data.pid}",
+                            current_data = current_data._replace(
+                                exitcode=ExitCode.TOOL_ENDED_USING_TASKKILL
                             )
-                            self.stop_threads()
+                            break
+                thread_name = f"Thread-PID-{current_data.pid}"
+                LoggerManager().log(
+                    "SYS",
+                    LoggerManagerThread.Level.DEBUG,
+                    "New data in the finished queue from PID-%d",
+                    current_data.pid,
+                    thread_name=thread_name,
+                )
 
-                        self.tool_manager.tool_data.data[
-                            "data_from_queue"
-                        ].append(current_data)
-                    else:
-                        queue_emptied = True
-                except queue.Empty:
-                    queue_emptied = True
+                if (
+                    parsed_args.stop_on_error
+                    and current_data.exitcode != int(ExitCode.OK)
+                ):
+                    LoggerManager().log(
+                        "SYS",
+                        LoggerManagerThread.Level.ERROR,
+                        "Instance PID-%d has ended prematurely!"
+                        % current_data.pid,
+                        thread_name=f"Thread-PID-{current_data.pid}",
+                    )
+                    self.stop_threads()
+
+                data_from_queue.append(current_data)
+
+            if threads_done:
+                break
 
     def stop_threads(self, *args):
         """
@@ -227,7 +235,8 @@ class AbstractExecutor(ABC):
             LoggerManager().log(
                 "SYS",
                 LoggerManagerThread.Level.DEBUG,
-                "Stopping %s" % curr_thread.name,
+                "Stopping %s",
+                curr_thread.name,
                 thread_name=curr_thread.name,
                 phase="EXECUTION",
             )
@@ -236,6 +245,7 @@ class AbstractExecutor(ABC):
             )
         time.sleep(5)
 
+        stuck_threads = []
         for curr_thread in self.live_threads():
             curr_thread.join(1)
             if curr_thread.is_alive():
@@ -246,13 +256,12 @@ class AbstractExecutor(ABC):
                     thread_name=curr_thread.name,
                     phase="EXECUTION",
                 )
-                taskkill_result = SystemHandler().os_system.stop_thread(
-                    curr_thread
-                )
-                if taskkill_result:
-                    self.tool_manager.tool_data.data[
-                        "taskkill_result_list"
-                    ].append(taskkill_result)
+                stuck_threads.append(curr_thread)
+
+        if stuck_threads:
+            self.tool_manager.tool_data.data["taskkill_result_list"].extend(
+                SystemHandler().os_system.stop_threads(stuck_threads)
+            )
 
         LoggerManager().log(
             "SYS",
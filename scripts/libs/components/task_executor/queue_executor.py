@@ -33,9 +33,11 @@ import collections
 from scripts.libs.definitions.imc import TOOL_NAME
 from scripts.libs.system_handler import SystemHandler
 from scripts.libs.components.runnable_threads.queue_thread import QueueThread
+from scripts.libs.components.runnable_threads.base_thread import TestResult
 from scripts.libs.components.loggers.logger_manager import (
     LoggerManager,
     LoggerManagerThread,
+    logger_manager,
 )
 from scripts.libs.components.os_system.abstract_system import AbstractSystem
 
@@ -72,33 +74,35 @@ class QueueExecutor(AbstractExecutor):
     ):
         """Execute the tool processes using subprocess, and retrieve the information"""
         creation_flags = os_system.creation_flags
-        test_result = collections.namedtuple(
-            "TestResult", "pid stdout stderr exitcode"
-        )
 
         with subprocess.Popen(
             exec_list,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             shell=False,
-            encoding="utf-8",
             creationflags=creation_flags,
         ) as proc:
-            LoggerManager().log(
-                "SYS",
-                LoggerManagerThread.Level.DEBUG,
-                "_run_cmd(): PID-%d about to start using %s",
-                proc.pid,
-                " ".join(exec_list),
-                thread_name=f"Thread-PID-{proc.pid}",
-                phase="EXECUTION",
-            )
+            if logger_manager.is_enabled_for(
+                "SYS", LoggerManagerThread.Level.DEBUG
+            ):
+                logger_manager.log(
+                    "SYS",
+                    LoggerManagerThread.Level.DEBUG,
+                    "_run_cmd(): PID-%d about to start using %s",
+                    proc.pid,
+                    " ".join(exec_list),
+                    thread_name=f"Thread-PID-{proc.pid}",
+                    phase="EXECUTION",
+                )
             pid_queue.put(proc.pid)  # tell the parent our pid
-            stdout = self._pipe_reader(proc.stdout)
-            stderr = self._pipe_reader(proc.stderr)
-            proc.wait()
+            # communicate() drains both pipes together, so a child filling
+            # one pipe cannot stall while the other is being read.
+            stdout, stderr = proc.communicate()
+            # The pipes are binary; each stream is decoded once, in full
+            stdout = stdout.decode("utf-8", errors="replace")
+            stderr = stderr.decode("utf-8", errors="replace")
             data_queue.put(
-                test_result(
+                TestResult(
                     pid=proc.pid,
                     stdout=stdout,
                     stderr=stderr,
@@ -128,9 +132,11 @@ class QueueExecutor(AbstractExecutor):
         if not commands_list:
             raise ValueError("No LPUs were detected!")
 
-        lpu_count = len(self.tool_manager.tool_data.parsed_args.lpus)
+        tool_data = self.tool_manager.tool_data
+        parsed_args = tool_data.parsed_args
+        lpu_count = len(parsed_args.lpus)
         cmd_count = len(commands_list)
-        tool_name = self.tool_manager.tool_data.TOOL_NAME
+        tool_name = tool_data.TOOL_NAME
 
         LoggerManager().log(
             "SYS",
@@ -138,37 +144,64 @@ class QueueExecutor(AbstractExecutor):
             f"Starting {lpu_count} thread instances to execute {cmd_count} test cases using the {tool_name} tool.",
         )
 
-        cmd_queue = queue.Queue(maxsize=cmd_count)
-        for command in commands_list:
-            cmd_queue.put(command)
+        cmd_queue = collections.deque(commands_list)
 
         self.threads = []
-        pid_queue = self.tool_manager.tool_data.data["pid_queue"]
-        result_queue = self.tool_manager.tool_data.data["result_queue"]
+        pid_queue = tool_data.data["pid_queue"]
+        result_queue = tool_data.data["result_queue"]
         os_system = SystemHandler().os_system
 
         for i in range(lpu_count):
-            thread = QueueThread(
-                cmd_queue,
-                result_queue,
-                pid_queue,
-                os_system,
+            self.threads.append(
+                QueueThread(
+                    cmd_queue,
+                    result_queue,
+                    pid_queue,
+                    os_system,
+                )
             )
-            self.threads.append(thread)
+
+        # Start every worker first so the instances are spawned concurrently,
+        # then wait up to 60 seconds in total for all of them to report a PID.
+        # Each worker records its own PID, so the order in which PIDs arrive
+        # does not matter.
+        for thread in self.threads:
             thread.start()
-            thread.pid = None
 
-            # Retrieve the PID of the thread
+        deadline = time.monotonic() + 60
+        pending = self.threads
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                thread.pid = pid_queue.get(timeout=60)
-                LoggerManager().log(
-                    "SYS",
-                    LoggerManagerThread.Level.DEBUG,
-                    f"{thread.name} has started PID-{thread.pid}!",
-                    thread_name=thread.name,
-                    phase="EXECUTION",
-                )
+                pid_queue.get(timeout=min(remaining, 0.5))
             except queue.Empty:
+                pass
+            pending = [
+                thread
+                for thread in pending
+                if thread.pid is None and thread.is_alive()
+            ]
+
+        # One summary line for the workers that started an instance
+        started = [thread for thread in self.threads if thread.pid is not None]
+        if started and logger_manager.is_enabled_for(
+            "SYS", LoggerManagerThread.Level.DEBUG
+        ):
+            logger_manager.log(
+                "SYS",
+                LoggerManagerThread.Level.DEBUG,
+                "%d of %d threads have started: %s",
+                len(started),
+                lpu_count,
+                ", ".join(
+                    f"{thread.name} PID-{thread.pid}" for thread in started
+                ),
+                phase="EXECUTION",
+            )
+        for thread in self.threads:
+            if thread.pid is None:
                 LoggerManager().log(
                     "SYS",
                     LoggerManagerThread.Level.ERROR,
@@ -177,7 +210,7 @@ class QueueExecutor(AbstractExecutor):
                     phase="EXECUTION",
                 )
 
-        timeout_seconds = self.tool_manager.tool_data.parsed_args.timeout
+        timeout_seconds = parsed_args.timeout
         end_time = time.time() + (timeout_seconds * 60)
 
         self.watch_threads(end_time)
@@ -189,18 +222,11 @@ class QueueExecutor(AbstractExecutor):
             phase="EXECUTION",
         )
 
-        self.tool_manager.tool_data.data["execution_completed"] = True
+        tool_data.data["execution_completed"] = True
 
         if hasattr(self.tool_manager, "logger"):
-            if (
-                hasattr(
-                    self.tool_manager.tool_data.parsed_args, "time_to_execute"
-                )
-                and self.tool_manager.tool_data.parsed_args.time_to_execute
-            ):
-                time_limit = (
-                    self.tool_manager.tool_data.parsed_args.time_to_execute
-                )
+            time_limit = getattr(parsed_args, "time_to_execute", None)
+            if time_limit:
                 self.tool_manager.logger.log_execution(
                     f"Time-based execution completed after configured time ({time_limit} second(s))"
                 )
@@ -26,6 +26,10 @@ from scripts.libs.data_handlers.abstract_data import AbstractDataHandler
 
 class MemoryData(AbstractDataHandler):
     def __init__(self, args_list=None, environment_os=None) -> None:
-        if not hasattr(self, "_initialized"):
-            super().__init__()
-            self._initialized = True
+        # SingletonMeta only runs __init__ when the instance is created
+        super().__init__()
+
+
+# Shared instance for modules that write memory details repeatedly;
+# `MemoryData()` returns this same object.
+memory_data = MemoryData()
@@ -165,50 +165,72 @@ class ExitCode(enum.Enum):
     )
     UNKNOWN_STATUS_CODE = 255, "An unknown error occurred"
 
+    def __init__(self, code, description):
+        # Unpacked once when the members are created so that conversions and
+        # comparisons read plain attributes instead of the value tuple.
+        self._code = code
+        self._description = description
+
     def __int__(self):
-        return int(self.value)
+        return self._code
 
     def __lt__(self, other):
-        if isinstance(other, (int, ExitCode)):
-            return int(self.value) < int(other)
+        if isinstance(other, ExitCode):
+            return self._code < other._code
+        if isinstance(other, int):
+            return self._code < other
         return NotImplemented
 
     def __gt__(self, other):
-        if isinstance(other, (int, ExitCode)):
-            return int(self.value) > int(other)
+        if isinstance(other, ExitCode):
+            return self._code > other._code
+        if isinstance(other, int):
+            return self._code > other
         return NotImplemented
 
     def __eq__(self, other):
-        if isinstance(other, (int, ExitCode)):
-            return int(self.value) == int(other)
+        if isinstance(other, ExitCode):
+            return self._code == other._code
+        if isinstance(other, int):
+            return self._code == other
         return NotImplemented
 
+    def __hash__(self):
+        # Consistent with __eq__, which treats a member as equal to its code
+        return hash(self._code)
+
     def __str__(self):
-        return self.description
+        return self._description
 
-    @enum.DynamicClassAttribute
+    @property
     def value(self):
         """
         Overrides the enum value method.  Gets the value of the Enum member.
         """
-        if isinstance(self._value_, tuple):
-            return self._value_[0]
-        return self._value_
+        return self._code
 
     @property
     def description(self):
         """Gets the description of the ExitCode enum."""
-        if isinstance(self._value_, tuple):
-            return self._value_[1]
-        return "No description available."
+        return self._description
 
     @classmethod
     def _missing_(cls, value):
         # override enums _missing_ to handle the tuple/exception
         # Since we're packing the enum with a tuple we might end up here when
         # running ExitCode(Num)
-        for member in cls.__members__.values():
-            if value in (member.value, member.name):
-                return member
+        try:
+            member = _LOOKUP.get(value)
+        except TypeError:  # unhashable value
+            member = None
         # Otherwise return a generic error
-        return cls.UNKNOWN_STATUS_CODE
+        return cls.UNKNOWN_STATUS_CODE if member is None else member
+
+
+# Members by code and by name, for ExitCode(code) and ExitCode(name); the
+# first member defined wins if two share a code.
+_LOOKUP = {}
+for _member in ExitCode.__members__.values():
+    _LOOKUP.setdefault(_member.value, _member)
+    _LOOKUP.setdefault(_member.name, _member)
+del _member
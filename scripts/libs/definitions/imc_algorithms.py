@@ -0,0 +1,459 @@
+#!/usr/bin/env python
+# /****************************************************************************
+# INTEL CONFIDENTIAL
+# Copyright 2017-2025 Intel Corporation.
+# This software and the related documents are Intel copyrighted materials,
+# and your use of them is governed by the express license under which they
+# were provided to you ("License"). Unless the License provides otherwise,
+# you may not use, modify, copy, publish, distribute, disclose or transmit
+# this software or the related documents without Intel's prior written
+# permission. This software and the related documents are provided as is,
+# with no express or implied warranties, other than those that are expressly
+# stated in the License.
+# -NDA Required
+# ****************************************************************************/
+
+# -*- coding: utf-8 -*-
+
+"""This module defines the IMC algorithms and the parameters each of them
+supports. It is loaded on first access to imc.IMCAlgorithm."""
+
+import collections
+
+from .imc import PatternType, ListTypes
+from .imc import ParameterIdentifier, ParameterName
+from .imc import IMCParameter, _make_param
+
+
+AlgorithmIdentifiers = collections.namedtuple(
+    "AlgorithmIdentifiers",
+    "algorithm_type pattern_count skip_base_pattern seed lower_limit_pattern "
+    "upper_limit_pattern incrementor decrementor",
+)
+
+# Identifiers of the pattern-dependant algorithm parameters.
+_ALGORITHM_IDENTIFIERS = {
+    PatternType.ADDRESS: AlgorithmIdentifiers(
+        ParameterIdentifier.ADDRESS_ALGORITHM_TYPE,
+        ParameterIdentifier.ADDRESS_PATTERN_COUNT,
+        ParameterIdentifier.ADDRESS_SKIP_BASE_PATTERN,
+        ParameterIdentifier.ADDRESS_SEED,
+        ParameterIdentifier.ADDRESS_LOWER_LIMIT_PATTERN,
+        ParameterIdentifier.ADDRESS_UPPER_LIMIT_PATTERN,
+        ParameterIdentifier.ADDRESS_INCREMENTOR,
+        ParameterIdentifier.ADDRESS_DECREMENTOR,
+    ),
+    PatternType.DATA: AlgorithmIdentifiers(
+        ParameterIdentifier.DATA_ALGORITHM_TYPE,
+        ParameterIdentifier.DATA_PATTERN_COUNT,
+        ParameterIdentifier.DATA_SKIP_BASE_PATTERN,
+        ParameterIdentifier.DATA_SEED,
+        ParameterIdentifier.DATA_LOWER_LIMIT_PATTERN,
+        ParameterIdentifier.DATA_UPPER_LIMIT_PATTERN,
+        ParameterIdentifier.DATA_INCREMENTOR,
+        ParameterIdentifier.DATA_DECREMENTOR,
+    ),
+}
+
+# Parameters every algorithm has, built once per pattern type.
+_ALGORITHM_BASE_PARAMETERS = {
+    pattern_type: frozenset(
+        (
+            IMCParameter(
+                ids.algorithm_type, True, str, ParameterName.ALGORITHM_TYPE
+            ),
+            IMCParameter(
+                ids.pattern_count, False, str, ParameterName.PATTERN_COUNT
+            ),
+            IMCParameter(
+                ids.skip_base_pattern,
+                False,
+                bool,
+                ParameterName.SKIP_BASE_PATTERN,
+            ),
+        )
+    )
+    for pattern_type, ids in _ALGORITHM_IDENTIFIERS.items()
+}
+
+
+class IMCAlgorithm:
+    """All supported algorithms.
+    Every algorithm is derived from base algorithm, which contains common
+    parameters all algorithms have.
+    All parameters each algorithm supports is defined inside the 'PARAMETERS'
+    set, of 'IMCParameter' type. Specialized algorithms declare their own
+    parameters in 'build_parameters', from the identifiers of a pattern
+    type."""
+
+    class Base:
+        type: PatternType
+        pattern_compability: PatternType
+        NAME: str = "UNKNOWN_ALGORITHM_NAME"
+        _algorithm_type: str
+        _pattern_count: str
+        _skip_base_pattern: str
+        _seed: str
+        _lower_limit_pattern: str
+        _upper_limit_pattern: str
+        _incrementor: str
+        _decrementor: str
+        _base_parameters: frozenset
+
+        PARAMETERS = frozenset()
+        _SUBCLASSES_BY_NAME = {}
+        _PARAMETERS_BY_TYPE = {}
+        _TYPES_BY_PATTERN_COMPABILITY = {}
+
+        def __init_subclass__(cls, **kwargs):
+            """Indexes every specialized algorithm by its name once, when
+            the subclass is defined, and builds its parameters for each
+            pattern type, since they only depend on the pair."""
+            super().__init_subclass__(**kwargs)
+            cls._SUBCLASSES_BY_NAME.setdefault(cls.NAME, cls)
+            cls._TYPES_BY_PATTERN_COMPABILITY.clear()
+            cls._PARAMETERS_BY_TYPE = {
+                pattern_type: _ALGORITHM_BASE_PARAMETERS[pattern_type].union(
+                    cls.build_parameters(ids)
+                )
+                for pattern_type, ids in _ALGORITHM_IDENTIFIERS.items()
+            }
+
+        @staticmethod
+        def build_parameters(ids):
+            """Builds the parameters specific to the algorithm.
+            :param ids: AlgorithmIdentifiers of the pattern type.
+            :return: set of 'IMCParameter'."""
+            return set()
+
+        @classmethod
+        def getSubclassByName(cls, name):
+            """Helper function to get an specialized algorithm by it's name.
+            :param name: name of the algorithm.
+            :return: the specialized algorithm subclass.
+            If not found returns None"""
+            return cls._SUBCLASSES_BY_NAME.get(name)
+
+        @classmethod
+        def getTypes(cls):
+            """Get all specialized algorithm subclasses.
+            :return: List of specialized algorithms."""
+            return list(cls._SUBCLASSES_BY_NAME.values())
+
+        @classmethod
+        def getTypesByPatternCompability(cls, pattern_type):
+            """Get compatible  algorithm subclasses, given a pattern.
+            The result is cached per pattern until a new subclass is
+            defined.
+            :return: Tuple of specialized algorithms."""
+            try:
+                return cls._TYPES_BY_PATTERN_COMPABILITY[pattern_type]
+            except KeyError:
+                algorithms = tuple(
+                    algorithm
+                    for algorithm in cls._SUBCLASSES_BY_NAME.values()
+                    if algorithm.pattern_compability
+                    == PatternType.DATA_AND_ADDRESS
+                    or algorithm.pattern_compability == pattern_type
+                )
+                cls._TYPES_BY_PATTERN_COMPABILITY[pattern_type] = algorithms
+                return algorithms
+
+        def __init__(self, type):
+            """Defines the identifier of pattern-dependant parameters for
+            the given pattern, and picks the parameters built for the
+            subclass and pattern."""
+            self.type = type
+            self._assign_identifiers(type)
+            self._base_parameters = _ALGORITHM_BASE_PARAMETERS[type]
+            self.PARAMETERS = self._PARAMETERS_BY_TYPE[type]
+
+        def _assign_identifiers(self, pattern_type):
+            """Sets the identifiers of the pattern-dependant parameters.
+            :raises ValueError: if the pattern type has no algorithm
+            parameters, e.g. UNKNOWN_PATTERN."""
+            try:
+                identifiers = _ALGORITHM_IDENTIFIERS[pattern_type]
+            except KeyError:
+                raise ValueError(
+                    f"Unsupported pattern type for algorithm {self.NAME}: "
+                    f"{pattern_type}"
+                ) from None
+            (
+                self._algorithm_type,
+                self._pattern_count,
+                self._skip_base_pattern,
+                self._seed,
+                self._lower_limit_pattern,
+                self._upper_limit_pattern,
+                self._incrementor,
+                self._decrementor,
+            ) = identifiers
+
+    class ByteAdd(Base):
+        NAME: str = "BYTE_ADD"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ParameterIdentifier.NUMBER_BYTES_TO_REPEAT, False, int
+                ),
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+            }
+
+    class Constant(Base):
+        NAME: str = "CONSTANT"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(ParameterIdentifier.CONSTANT_PATTERN, False, int)
+            }
+
+    class DancingBits(Base):
+        NAME: str = "DANCING_BITS"
+        pattern_compability = PatternType.DATA
+
+    class Decrement(Base):
+        NAME: str = "DECREMENT"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.lower_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.LOWER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.decrementor, False, int, ParameterName.DECREMENTOR
+                ),
+            }
+
+    class FastRandom(Base):
+        NAME: str = "FAST_RANDOM"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.lower_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.LOWER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+            }
+
+    class GLFSR(Base):
+        NAME: str = "GLFSR"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+            }
+
+    class Increment(Base):
+        NAME: str = "INCREMENT"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.incrementor, False, int, ParameterName.INCREMENTOR
+                ),
+            }
+
+    class LFSR(Base):
+        NAME: str = "LFSR"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+            }
+
+    class Negator(Base):
+        NAME: str = "NEGATOR"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+            }
+
+    class PatternList(Base):
+        NAME: str = "PATTERN_LIST"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ParameterIdentifier.PATTERN_LIST,
+                    False,
+                    (list, ListTypes.Pattern_List),
+                )
+            }
+
+    class Pivot(Base):
+        NAME: str = "PIVOT"
+        pattern_compability = PatternType.ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.lower_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.LOWER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+                _make_param(ParameterIdentifier.CHANGE_PIVOT, False, bool),
+                _make_param(
+                    ParameterIdentifier.PIVOT_INITIAL_POSITION, False, int
+                ),
+            }
+
+    class SetAssociative(Base):
+        NAME: str = "SET_ASSOCIATIVE"
+        pattern_compability = PatternType.ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.lower_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.LOWER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+                _make_param(ParameterIdentifier.SET_STRIDE, False, int),
+                _make_param(ParameterIdentifier.WAY_STRIDE, False, int),
+                _make_param(ParameterIdentifier.BLOCKS_PER_SET, False, int),
+                _make_param(ParameterIdentifier.MAX_SETS_TO_EVICT, False, int),
+            }
+
+    class Shifting(Base):
+        NAME: str = "SHIFTING"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+            }
+
+    class WalkingOne(Base):
+        NAME: str = "WALKING_ONE"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.lower_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.LOWER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+            }
+
+    class WalkingZero(Base):
+        NAME: str = "WALKING_ZERO"
+        pattern_compability = PatternType.DATA_AND_ADDRESS
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.lower_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.LOWER_LIMIT_PATTERN,
+                ),
+                _make_param(
+                    ids.upper_limit_pattern,
+                    False,
+                    int,
+                    ParameterName.UPPER_LIMIT_PATTERN,
+                ),
+            }
+
+    class Wedge(Base):
+        NAME: str = "WEDGE"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(ParameterIdentifier.WEDGE_SIZE, False, int),
+                _make_param(ParameterIdentifier.CHANGE_WEDGE, False, bool),
+            }
+
+    class Xtalk(Base):
+        NAME: str = "XTALK"
+        pattern_compability = PatternType.DATA
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ParameterIdentifier.NUMBER_CACHE_LINES, False, int
+                ),
+                _make_param(ids.seed, False, int, ParameterName.SEED),
+                _make_param(ParameterIdentifier.SECONDARY, False, bool),
+            }
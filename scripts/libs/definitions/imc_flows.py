@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# /****************************************************************************
+# INTEL CONFIDENTIAL
+# Copyright 2017-2025 Intel Corporation.
+# This software and the related documents are Intel copyrighted materials,
+# and your use of them is governed by the express license under which they
+# were provided to you ("License"). Unless the License provides otherwise,
+# you may not use, modify, copy, publish, distribute, disclose or transmit
+# this software or the related documents without Intel's prior written
+# permission. This software and the related documents are provided as is,
+# with no express or implied warranties, other than those that are expressly
+# stated in the License.
+# -NDA Required
+# ****************************************************************************/
+
+# -*- coding: utf-8 -*-
+
+"""This module defines the IMC flows and the parameters each of them
+supports. It is loaded on first access to imc.IMCFlow."""
+
+from .imc import PatternType, ListTypes, IMCOpcodeType
+from .imc import IMCParameter, ParameterIdentifier, ParameterName
+from .imc_algorithms import IMCAlgorithm
+
+
+# Parameters every flow has.
+_FLOW_BASE_PARAMETERS = frozenset(
+    (
+        IMCParameter(ParameterIdentifier.FLOW_TYPE, True, str),
+        IMCParameter(ParameterIdentifier.OPCODE, True, IMCOpcodeType),
+        IMCParameter(ParameterIdentifier.BYPASS_WRITE_PHASE, False, bool),
+        IMCParameter(ParameterIdentifier.BYPASS_READ_PHASE, False, bool),
+        IMCParameter(ParameterIdentifier.CONTINUE_ON_FAIL, False, bool),
+        IMCParameter(ParameterIdentifier.ITERATIONS, False, int),
+        IMCParameter(ParameterIdentifier.WRITE_ONCE, False, bool),
+        IMCParameter(ParameterIdentifier.MATCH_MASK, False, str),
+        IMCParameter(ParameterIdentifier.MATCH_VALUE, False, str),
+        IMCParameter(ParameterIdentifier.ALIGNMENT, False, int),
+        IMCParameter(ParameterIdentifier.PARTIAL_WRITE, False, bool),
+        IMCParameter(
+            ParameterIdentifier.RESTART_ALGORITHM_AT_ITERATION, False, bool
+        ),
+    )
+)
+
+
+class IMCFlow:
+    """All supported flows.
+    Every flow is derived from base flow, which contains common parameters
+    all flows have.
+    All parameters each flow supports is defined inside the 'PARAMETERS' set,
+    of 'IMCParameter' type."""
+
+    class Base:
+        type = PatternType.UNKNOWN_PATTERN
+        NAME: str = "UNKNOWN_FLOW_NAME"
+        _BASE_PARAMETERS = _FLOW_BASE_PARAMETERS
+        PARAMETERS = frozenset()
+        _MERGED_PARAMETERS = _FLOW_BASE_PARAMETERS
+        _SUBCLASSES_BY_NAME = {}
+
+        def __init_subclass__(cls, **kwargs):
+            """Indexes every specialized flow by its name, and merges its
+            parameters with the base ones once for all its instances."""
+            super().__init_subclass__(**kwargs)
+            cls._SUBCLASSES_BY_NAME.setdefault(cls.NAME, cls)
+            cls._MERGED_PARAMETERS = _FLOW_BASE_PARAMETERS.union(
+                cls.PARAMETERS
+            )
+
+        @classmethod
+        def getTypes(cls):
+            """Get all specialized flow subclasses.
+            :return: List of specialized flows."""
+            return list(cls._SUBCLASSES_BY_NAME.values())
+
+        @classmethod
+        def getSubclassByName(cls, name):
+            """Helper function to get an specialized flow by it's name.
+            :param name: name of the flow.
+            :return: the specialized flow subclass.
+            If not found returns None"""
+            return cls._SUBCLASSES_BY_NAME.get(name)
+
+        def __init__(self):
+            """Picks the parameters merged for the specialized flow."""
+            self.PARAMETERS = self._MERGED_PARAMETERS
+
+    class DataHarasser(Base):
+        type = PatternType.DATA
+        NAME: str = "DATA_HARASSER"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.DATA_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.ALGORITHM,
+                )
+            }
+        )
+
+    class AddressHarasser(Base):
+        type = PatternType.ADDRESS
+        NAME: str = "ADDRESS_HARASSER"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.ADDRESS_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.ALGORITHM,
+                )
+            }
+        )
+
+    class March(Base):
+        type = PatternType.DATA
+        NAME: str = "MARCH"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.DATA_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.DATA_ALGORITHM,
+                ),
+                IMCParameter(
+                    ParameterIdentifier.MARCH_ELEMENT,
+                    True,
+                    (list, ListTypes.March_Element),
+                ),
+            }
+        )
+
+    class MarchSimpleStatic(Base):
+        type = PatternType.DATA_AND_ADDRESS
+        NAME: str = "MARCH_SIMPLE_STATIC"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.DATA_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.DATA_ALGORITHM,
+                ),
+                IMCParameter(
+                    ParameterIdentifier.ADDRESS_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.ADDRESS_ALGORITHM,
+                ),
+            }
+        )
+
+    class Custom(Base):
+        type = PatternType.DATA_AND_ADDRESS
+        NAME: str = "CUSTOM"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.DATA_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.DATA_ALGORITHM,
+                ),
+                IMCParameter(
+                    ParameterIdentifier.ADDRESS_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.ADDRESS_ALGORITHM,
+                ),
+            }
+        )
+
+    class Burster(Base):
+        type = PatternType.DATA_AND_ADDRESS
+        NAME: str = "BURSTER"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.DATA_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.DATA_ALGORITHM,
+                ),
+                IMCParameter(
+                    ParameterIdentifier.ADDRESS_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.ADDRESS_ALGORITHM,
+                ),
+                IMCParameter(ParameterIdentifier.DATA_BURSTS, True, str),
+                IMCParameter(ParameterIdentifier.SAME_ADDRESS, False, str),
+            }
+        )
+
+    class Blackbird(Base):
+        type = PatternType.DATA_AND_ADDRESS
+        NAME: str = "BLACKBIRD"
+        PARAMETERS = frozenset(
+            {
+                IMCParameter(
+                    ParameterIdentifier.DATA_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.DATA_ALGORITHM,
+                ),
+                IMCParameter(
+                    ParameterIdentifier.ADDRESS_ALGORITHM_TYPE,
+                    True,
+                    IMCAlgorithm,
+                    ParameterName.ADDRESS_ALGORITHM,
+                ),
+            }
+        )
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# /****************************************************************************
+# INTEL CONFIDENTIAL
+# Copyright 2017-2025 Intel Corporation.
+# This software and the related documents are Intel copyrighted materials,
+# and your use of them is governed by the express license under which they
+# were provided to you ("License"). Unless the License provides otherwise,
+# you may not use, modify, copy, publish, distribute, disclose or transmit
+# this software or the related documents without Intel's prior written
+# permission. This software and the related documents are provided as is,
+# with no express or implied warranties, other than those that are expressly
+# stated in the License.
+# -NDA Required
+# ****************************************************************************/
+
+# -*- coding: utf-8 -*-
+
+"""This module defines the IMC memory blocks and groups, and the parameters
+each of them supports. It is loaded on first access to imc.IMCMemory."""
+
+import collections
+
+from .imc import MemoryType, IMCMappingMode
+from .imc import ParameterIdentifier, ParameterName
+from .imc import _make_param
+
+
+MemoryIdentifiers = collections.namedtuple(
+    "MemoryIdentifiers",
+    "memory_allocator_type memory_size mapping_mode allow_aliasing "
+    "enable_exec_mapping enable_read_mapping enable_write_mapping "
+    "physical_address physical_address_low physical_address_high "
+    "target_path",
+)
+
+# Identifiers of the type-dependant memory parameters. Memory blocks name
+# their allocator type parameter after ParameterName.MEMORY_ALLOCATOR_TYPE.
+_MEMORY_IDENTIFIERS = {
+    MemoryType.BLOCK: MemoryIdentifiers(
+        ParameterName.MEMORY_ALLOCATOR_TYPE,
+        ParameterIdentifier.MEMORY_SIZE_IN_BYTES,
+        ParameterIdentifier.MEMORY_BLOCK_MAPPING_MODE,
+        ParameterIdentifier.MEMORY_BLOCK_ALLOW_ALIASING,
+        ParameterIdentifier.MEMORY_BLOCK_ENABLE_EXEC_MAPPING,
+        ParameterIdentifier.MEMORY_BLOCK_ENABLE_READ_MAPPING,
+        ParameterIdentifier.MEMORY_BLOCK_ENABLE_WRITE_MAPPING,
+        ParameterIdentifier.MEMORY_BLOCK_PHYSICAL_ADDRESS,
+        ParameterIdentifier.MEMORY_BLOCK_PHYSICAL_ADDRESS_LOW,
+        ParameterIdentifier.MEMORY_BLOCK_PHYSICAL_ADDRESS_HIGH,
+        ParameterIdentifier.MEMORY_BLOCK_TARGET_PATH,
+    ),
+    MemoryType.GROUP: MemoryIdentifiers(
+        ParameterIdentifier.MEMORY_GROUP_BLOCK_TYPE,
+        ParameterIdentifier.MEMORY_GROUP_SIZE_IN_BYTES,
+        ParameterIdentifier.MEMORY_GROUP_MAPPING_MODE,
+        ParameterIdentifier.MEMORY_GROUP_ALLOW_ALIASING,
+        ParameterIdentifier.MEMORY_GROUP_ENABLE_EXEC_MAPPING,
+        ParameterIdentifier.MEMORY_GROUP_ENABLE_READ_MAPPING,
+        ParameterIdentifier.MEMORY_GROUP_ENABLE_WRITE_MAPPING,
+        ParameterIdentifier.MEMORY_GROUP_PHYSICAL_ADDRESS,
+        ParameterIdentifier.MEMORY_GROUP_PHYSICAL_ADDRESS_LOW,
+        ParameterIdentifier.MEMORY_GROUP_PHYSICAL_ADDRESS_HIGH,
+        ParameterIdentifier.MEMORY_GROUP_TARGET_PATH,
+    ),
+}
+
+# Parameters every memory block/group of a type has, built once per type.
+# Memory groups also require the overall group definition.
+_MEMORY_BASE_PARAMETERS = {
+    memory_type: frozenset(
+        (
+            _make_param(
+                ids.memory_allocator_type,
+                True,
+                str,
+                ParameterName.MEMORY_ALLOCATOR_TYPE,
+            ),
+            _make_param(ids.memory_size, True, int, ParameterName.MEMORY_SIZE),
+        )
+        + (
+            (
+                _make_param(
+                    ParameterIdentifier.MEMORY_GROUP_OVERALL,
+                    True,
+                    str,
+                    ParameterName.MEMORY_BLOCK_GROUP_OVERALL,
+                ),
+            )
+            if memory_type == MemoryType.GROUP
+            else ()
+        )
+    )
+    for memory_type, ids in _MEMORY_IDENTIFIERS.items()
+}
+
+
+# IMC Memory classes
+class IMCMemory:
+    """All supported memory types and allocation types.
+    Every specialized memory block/group is derived from a base one,
+    which contains common parameters all types have.
+    The parameters each memory block/group supports is defined inside the
+    'PARAMETERS' set, of 'IMCParameter' type."""
+
+    class Base:
+        type: MemoryType
+        NAME = "UNKNOWN_MEMORY_TYPE_NAME"
+        _target_path: str
+        _physical_address_high: str
+        _physical_address_low: str
+        _physical_address: str
+        _enable_read_mapping: str
+        _enable_write_mapping: str
+        _enable_exec_mapping: str
+        _allow_aliasing: str
+        _mapping_mode: str
+        _memory_size: str
+        _memory_allocator_type: str
+        _base_parameters: frozenset
+        PARAMETERS: frozenset
+
+        # Instances only hold the attributes set in __init__; subclasses
+        # declare empty slots and keep their parameters in the class cache.
+        __slots__ = (
+            "type",
+            "_target_path",
+            "_physical_address_high",
+            "_physical_address_low",
+            "_physical_address",
+            "_enable_read_mapping",
+            "_enable_write_mapping",
+            "_enable_exec_mapping",
+            "_allow_aliasing",
+            "_mapping_mode",
+            "_memory_size",
+            "_memory_allocator_type",
+            "_base_parameters",
+            "PARAMETERS",
+        )
+
+        _SUBCLASSES_BY_NAME = {}
+        _PARAMETERS_BY_TYPE = {}
+
+        def __init_subclass__(cls, **kwargs):
+            """Indexes every specialized memory block by its name, and
+            builds its base and merged parameters for each memory type,
+            since they only depend on the pair."""
+            super().__init_subclass__(**kwargs)
+            cls._SUBCLASSES_BY_NAME.setdefault(cls.NAME, cls)
+            cls._PARAMETERS_BY_TYPE = {}
+            for memory_type, ids in _MEMORY_IDENTIFIERS.items():
+                base_parameters = _MEMORY_BASE_PARAMETERS[memory_type]
+                cls._PARAMETERS_BY_TYPE[memory_type] = (
+                    base_parameters,
+                    base_parameters | frozenset(cls.build_parameters(ids)),
+                )
+
+        @classmethod
+        def getTypes(cls):
+            """Get all specialized memory block subclasses.
+            :return: List of specialized memory blocks."""
+            return list(cls._SUBCLASSES_BY_NAME.values())
+
+        @classmethod
+        def getSubclassByName(cls, name):
+            """Helper function to get an specialized memory block by it's name.
+            :param name: name of the memory block allocator.
+            :return: the specialized memory block subclass.
+            If not found returns None"""
+            return cls._SUBCLASSES_BY_NAME.get(name)
+
+        def __init__(self, type):
+            """Defines the identifier of type-dependant parameters for the
+            given memory type, and picks the parameters built for the
+            subclass and memory type."""
+            self.type = type
+            self._assign_identifiers(type)
+            self._base_parameters, self.PARAMETERS = (
+                self._PARAMETERS_BY_TYPE[type]
+            )
+
+        @staticmethod
+        def build_parameters(ids):
+            """Builds the parameters specific to the memory allocator.
+            :param ids: MemoryIdentifiers of the memory type.
+            :return: set of 'IMCParameter'."""
+            return set()
+
+        def _assign_identifiers(self, memory_type):
+            """Sets the identifiers of the type-dependant parameters.
+            :raises ValueError: if the memory type is not supported."""
+            try:
+                identifiers = _MEMORY_IDENTIFIERS[memory_type]
+            except KeyError:
+                raise ValueError(
+                    f"Unsupported memory type for {self.NAME}: {memory_type}"
+                ) from None
+            (
+                self._memory_allocator_type,
+                self._memory_size,
+                self._mapping_mode,
+                self._allow_aliasing,
+                self._enable_exec_mapping,
+                self._enable_read_mapping,
+                self._enable_write_mapping,
+                self._physical_address,
+                self._physical_address_low,
+                self._physical_address_high,
+                self._target_path,
+            ) = identifiers
+
+    class Malloc(Base):
+        NAME: str = "MALLOC"
+        __slots__ = ()
+
+    class SVOS(Base):
+        NAME: str = "SVOS"
+        __slots__ = ()
+
+        @staticmethod
+        def build_parameters(ids):
+            return {
+                _make_param(
+                    ids.mapping_mode,
+                    False,
+                    IMCMappingMode,
+                    ParameterName.MEMORY_MAPPING_MODE,
+                ),
+                _make_param(
+                    ids.target_path, False, str, ParameterName.TARGET_PATH
+                ),
+                _make_param(
+                    ids.physical_address_high,
+                    False,
+                    int,
+                    ParameterName.PHYSICAL_ADDRESS_HIGH,
+                ),
+                _make_param(
+                    ids.physical_address_low,
+                    False,
+                    int,
+                    ParameterName.PHYSICAL_ADDRESS_LOW,
+                ),
+                _make_param(
+                    ids.physical_address,
+                    False,
+                    int,
+                    ParameterName.PHYSICAL_ADDRESS,
+                ),
+                _make_param(
+                    ids.enable_read_mapping,
+                    False,
+                    bool,
+                    ParameterName.ENABLE_READ_MAPPING,
+                ),
+                _make_param(
+                    ids.enable_write_mapping,
+                    False,
+                    bool,
+                    ParameterName.ENABLE_WRITE_MAPPING,
+                ),
+                _make_param(
+                    ids.enable_exec_mapping,
+                    False,
+                    bool,
+                    ParameterName.ENABLE_EXEC_MAPPING,
+                ),
+                _make_param(
+                    ids.allow_aliasing,
+                    False,
+                    bool,
+                    ParameterName.ALLOW_ALIASING,
+                ),
+            }
@@ -42,3 +42,4 @@ class DefaultPaths:
     CMAKE_SCRIPT = "/CMakeLists.script.txt"
     DPKG = "/Debian-Package-files-generated"
     LICENSES = "/licenses"
+    BUILD_DPKG = BUILD + DPKG
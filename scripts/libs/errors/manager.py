@@ -20,7 +20,7 @@ This is the error manager base module which defines the base ErrorManager class.
 """
 
 import logging
-from typing import List, Set, Optional
+from typing import FrozenSet, List, Optional
 
 from scripts.libs.errors.providers.factory import create_provider
 from scripts.libs.definitions.errors import ErrorEntry, ErrorProvider
@@ -38,6 +38,14 @@ class ErrorManager:
     Management interface for working with the providers and detecting errors
     """
 
+    __slots__ = (
+        "_collection_method",
+        "_start_errors",
+        "_end_errors",
+        "_provider",
+        "_provider_is_fake",
+    )
+
     def __init__(
         self,
         collection_method: ErrorProvider = ErrorProvider.NoProvider,
@@ -49,14 +57,20 @@ class ErrorManager:
         collection
         """
         self._collection_method = collection_method
-        self._start_errors = []
-        self._end_errors = []
+        self._start_errors = frozenset()
+        self._end_errors = frozenset()
         self._provider = None
+        self._provider_is_fake = False  # LOD (imc_internal)
 
         try:
             self._provider = create_provider(collection_method)
             if self._provider:
                 self._provider.init()
+                # LOD (imc_internal)
+                self._provider_is_fake = hasattr(
+                    self._provider, "_fake_error"
+                )
+                # LOD END
 
         except ErrorProviderNotFound as ex:
             if log_msg:
@@ -70,7 +84,7 @@ class ErrorManager:
 
         :return: None
         """
-        self._start_errors = self.get_errors()
+        self._start_errors = frozenset(self.get_errors())
 
     def mark_end(self):
         """
@@ -79,15 +93,16 @@ class ErrorManager:
 
         :return: None
         """
-        self._end_errors = self.get_errors()
+        self._end_errors = frozenset(self.get_errors())
 
-    def get_marked_errors(self) -> Set[ErrorEntry]:
+    def get_marked_errors(self) -> FrozenSet[ErrorEntry]:
         """Generates a set of differences between the baseline errors and the
-        final error list and returns them to the caller.
+        final error list and returns them to the caller. Both lists are
+        stored as sets when marked.
 
         :return: Set of error entries encountered during the testing.
         """
-        return set(self._end_errors).difference(set(self._start_errors))
+        return self._end_errors - self._start_errors
 
     def get_errors(self) -> List[ErrorEntry]:
         """Retrieves a list of error entries from the current error provider.
@@ -122,5 +137,5 @@ class ErrorManager:
         """
         if self._provider is None:
             raise ErrorProviderNotFound
-        if hasattr(self._provider, "_fake_error"):  # LOD (imc_internal)
+        if self._provider_is_fake:  # LOD (imc_internal)
             raise ErrorProviderNotFound  # LOD (imc_internal)
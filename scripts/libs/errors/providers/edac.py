@@ -164,6 +164,8 @@ class EDACProvider(BaseProvider):
     RESULT_ROW_ITEM_COUNT = 5
     RESULT_ROW_DELIMITER = ":"
 
+    __slots__ = ("command_line_arguments",)
+
     def __init__(self, path: Optional[str] = None):
         """Constructor
 
@@ -300,6 +302,8 @@ if DEV_MODE:
 
         FAKE_LOG_FILE = os.path.join(os.path.dirname(__file__), "fake_edac.log")
 
+        __slots__ = ("_counter", "_fake_error")
+
         def __init__(self, path: str = None):
             super().__init__(path=path)
             self._counter = 0
@@ -105,6 +105,8 @@ class EDACFsProvider(EDACProvider):
     # mc directory in edac file system
     EDAC_MC_PATH = "/sys/devices/system/edac/mc"
 
+    __slots__ = ()
+
     def __init__(self, path: Optional[str] = None):
         super().__init__(path=path)
 
@@ -131,6 +131,8 @@ class FtraceProvider(BaseProvider):
     RESULT_ROW_ITEM_COUNT = 5
     RESULT_ROW_DELIMITER = ":"
 
+    __slots__ = ("events", "prev_state")
+
     def __init__(self, events: Optional[list] = None):
         """Constructor"""
         if not events:
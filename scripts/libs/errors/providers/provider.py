@@ -16,21 +16,29 @@
 
 """ This module defines the base provider class that must be overridden. """
 
+from abc import ABC, abstractmethod
 
-class BaseProvider:
+
+class BaseProvider(ABC):
     """Base Error Provider interface"""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: str = None):
         self.path = path
 
+    @abstractmethod
     def _self_test(self):
         raise NotImplementedError()
 
+    @abstractmethod
     def init(self):
         raise NotImplementedError()
 
+    @abstractmethod
     def get_errors(self):
         raise NotImplementedError()
 
+    @abstractmethod
     def clear(self):
         raise NotImplementedError()
@@ -65,6 +65,7 @@ class ImcRunnable(AbstractRunnable):
 
         verbosity = SystemHandler().get_verbosity()
         self.logger_name = "IMC"
+        self._preserved_loggers = (self.logger_name, "IMC", "SYS")
         log_level = get_log_level_from_verbosity(verbosity)
 
         # Initialize the IMC logger
@@ -101,6 +102,7 @@ class ImcRunnable(AbstractRunnable):
 
         tm = self.tool_manager
         logger = self.logger
+        logger_manager = LoggerManager()
 
         logger.start_execution()
 
@@ -117,27 +119,24 @@ class ImcRunnable(AbstractRunnable):
             commands = self.distribution.generate_commands()
             command_count = len(commands) if commands else 0
 
-            init_message = f"Generated {command_count} execution commands"
+            init_message = "Generated %d execution commands"
+            init_args = [command_count]
 
             parsed_args = tm.tool_data.parsed_args
             if (
                 hasattr(parsed_args, "time_to_execute")
                 and parsed_args.time_to_execute
             ):
-                time_limit = parsed_args.time_to_execute
-                init_message += (
-                    f" | Time-based execution: {time_limit} second(s)"
-                )
+                init_message += " | Time-based execution: %s second(s)"
+                init_args.append(parsed_args.time_to_execute)
 
-            logger.log_initialization(init_message)
+            logger.log_initialization(init_message, *init_args)
             logger.end_phase("INITIALIZATION")
 
             logger.start_phase("EXECUTION")
             logger.log_execution("Executing IMC instances...")
 
-            LoggerManager().set_preserve_loggers(
-                [self.logger_name, "IMC", "SYS"]
-            )
+            logger_manager.set_preserve_loggers(self._preserved_loggers)
 
             self.executor.executeInstances(commands)
 
@@ -148,41 +147,44 @@ class ImcRunnable(AbstractRunnable):
 
         except Exception as e:
             error_str = str(e)
-            LoggerManager().log(
+            logger_manager.log(
                 self.logger_name,
                 LoggerManagerThread.Level.ERROR,
-                f"Error: {error_str}",
+                "Error: %s",
+                error_str,
             )
             tm.tool_data.data["execution_error"] = error_str
 
+        data = tm.tool_data.data
+        time_limit_reached = data.get("time_limit_reached", False)
+
         try:
-            if tm.tool_data.data.get("time_limit_reached", False):
-                if not LoggerManager().manager_thread.has_logger(
+            if time_limit_reached:
+                if not logger_manager.manager_thread.has_logger(
                     self.logger_name
                 ):
-                    LoggerManager().create_logger(
+                    logger_manager.create_logger(
                         name=self.logger_name,
                         log_level=LoggerManagerThread.Level.INFO,
                     )
 
             logger.start_phase("POST_EXECUTION")
 
-            debug_log_file = LoggerManager().get_debug_log_file()
+            debug_log_file = logger_manager.get_debug_log_file()
             if debug_log_file:
                 logger.log_post_execution(
-                    f"Complete debug logs have been written to: {debug_log_file}"
+                    "Complete debug logs have been written to: %s",
+                    debug_log_file,
                 )
                 logger.log_post_execution(
                     "This file contains all detailed logs including those not shown in the terminal."
                 )
 
-            if tm.tool_data.data.get("time_limit_reached", False) and hasattr(
-                parsed_args, "time_to_execute"
-            ):
+            if time_limit_reached and hasattr(parsed_args, "time_to_execute"):
                 logger.log_post_execution(
-                    f"Processing results after time-based completion"
+                    "Processing results after time-based completion"
                 )
-            elif "execution_error" in tm.tool_data.data:
+            elif "execution_error" in data:
                 logger.log_post_execution(
                     "Processing results after execution error"
                 )
@@ -192,12 +194,13 @@ class ImcRunnable(AbstractRunnable):
             result = tm.post_process()
             logger.end_phase("POST_EXECUTION")
 
-            was_successful = ("execution_error" not in tm.tool_data.data) and (
+            # post_process() may flag an execution error of its own
+            was_successful = ("execution_error" not in data) and (
                 result == ExitCode.OK
             )
             logger.end_execution(success=was_successful, exit_code=result)
 
-            LoggerManager().log(
+            logger_manager.log(
                 self.logger_name,
                 LoggerManagerThread.Level.INFO,
                 "All execution logs completed",
@@ -205,10 +208,11 @@ class ImcRunnable(AbstractRunnable):
 
         except Exception as post_error:
             error_str = str(post_error)
-            LoggerManager().log(
+            logger_manager.log(
                 self.logger_name,
                 LoggerManagerThread.Level.ERROR,
-                f"Post-processing error: {error_str}",
+                "Post-processing error: %s",
+                error_str,
             )
             logger.end_execution(success=False, exit_code=str(post_error))
             raise
@@ -15,9 +15,8 @@
 
 from __future__ import annotations
 from threading import Lock
+import collections
 import enum
-import inspect
-from itertools import tee
 import sys
 from abc import ABC, abstractmethod
 
@@ -40,6 +39,12 @@ from scripts.libs.test_generator.generator_parser import (
     get_supported_algorithm_types,
 )
 
+# Parameter options shown by FlowParametersMenu and AlgorithmParametersMenu.
+# They only depend on the flow name or the (algorithm, pattern) pair, so they
+# are built the first time a menu asks for them and shared afterwards.
+_FLOW_OPTIONS = {}
+_ALGORITHM_OPTIONS = {}
+
 
 def _parse_user_input(user_input, type):
     """
@@ -51,8 +56,9 @@ def _parse_user_input(user_input, type):
         sys.exit("No test cases were generated.")
 
     elif user_input == "":  # Handle next menu.
-        if MenuContext().get_current_menu().menu_is_complete():
-            MenuContext().get_current_menu().next_menu()
+        current_menu = MenuContext().get_current_menu()
+        if current_menu.menu_is_complete():
+            current_menu.next_menu()
         else:
             input("Complete the current menu first.")
         return (False, None)
@@ -85,49 +91,61 @@ def _handle_specialized_data(selected_option):
         2. False
         """
         )
-        user_input = str(input("Choose value: "))
-        (is_valid, sanitized_input) = _parse_user_input(user_input, int)
-        if is_valid:
-            if sanitized_input == 1:
-                return "true"
-            elif sanitized_input == 2:
-                return "false"
-        else:
-            _handle_specialized_data(selected_option)
+        # Ask again until the user picks one of the listed options.
+        while True:
+            user_input = str(input("Choose value: "))
+            (is_valid, sanitized_input) = _parse_user_input(user_input, int)
+            if is_valid:
+                if sanitized_input == 1:
+                    return "true"
+                elif sanitized_input == 2:
+                    return "false"
 
     elif isinstance(data_type, tuple):
         if data_type[0] == list:
             msg = "How many elements do you want in the list?: "
-            user_input = str(input(msg))
-            (is_valid, sanitized_input) = _parse_user_input(user_input, int)
-            if is_valid:
-                list_string: str = ""
-                for number in range(sanitized_input):
-                    user_input = str(input(f"Input element {number+1}: "))
-                    if data_type[1] == ListTypes.March_Element:
-                        list_string += "[" + user_input + "],"
-                    elif data_type[1 == ListTypes.Pattern_List]:
-                        list_string += user_input + ","
-                return list_string
-        else:
-            _handle_specialized_data(selected_option)
+            while True:
+                user_input = str(input(msg))
+                (is_valid, sanitized_input) = _parse_user_input(
+                    user_input, int
+                )
+                if is_valid:
+                    break
+
+            list_string: str = ""
+            for number in range(sanitized_input):
+                user_input = str(input(f"Input element {number+1}: "))
+                if data_type[1] == ListTypes.March_Element:
+                    list_string += "[" + user_input + "],"
+                elif data_type[1] == ListTypes.Pattern_List:
+                    list_string += user_input + ","
+            return list_string
 
     elif data_type == IMCTimeType:
-        MenuContext()._change_menu_to(
+        context = MenuContext()
+        context._change_menu_to(
             TimeSelectionMenu(
-                MenuContext().get_current_menu(), selected_option.identifier
+                context.get_current_menu(), selected_option.identifier
             )
         )
     else:
-        MenuContext()._change_menu_to(
+        context = MenuContext()
+        context._change_menu_to(
             ListSelectionMenu(
-                MenuContext().get_current_menu(),
+                context.get_current_menu(),
                 data_type,
                 selected_option.identifier,
             )
         )
 
 
+# Formatted copy of a MenuStrings member. It keeps the member's name and
+# value attributes, so callers reading menu_strings.value are unaffected.
+_FormattedMenuStrings = collections.namedtuple(
+    "_FormattedMenuStrings", ("name", "value")
+)
+
+
 class MenuStrings(enum.Enum):
     """Instructions or text shown inside each menu.
     Declared as a tuple: the menu title and the instruction text."""
@@ -175,25 +193,16 @@ Choose type of memory: """,
         :param enum_member: enum to add dynamic text
         :param replacement_string: string to add to text.
                                 A list if multiple strings.
-        :return: Copy of the enum with the text replaced.
+        :return: Copy of the member with the text replaced.
         """
 
-        if isinstance(replacement_string, list):
-            formatted_value = (
-                enum_member.value[0],
-                enum_member.value[1].format(*replacement_string),
-            )
+        if not isinstance(replacement_string, list):
+            replacement_string = (replacement_string,)
 
-        else:
-            formatted_value = (
-                enum_member.value[0],
-                enum_member.value[1].format(replacement_string),
-            )
-
-        new_enum = enum.Enum(
-            "MenuStrings", {enum_member.name: formatted_value}
-        )[enum_member.name]
-        return new_enum
+        (title, text) = enum_member.value
+        return _FormattedMenuStrings(
+            enum_member.name, (title, text.format(*replacement_string))
+        )
 
 
 class SingletonMeta(type):
@@ -203,11 +212,16 @@ class SingletonMeta(type):
     _lock: Lock = Lock()
 
     def __call__(cls, *args, **kwargs):
-        with cls._lock:
-            if cls not in cls._instances:
-                instance = super().__call__(*args, **kwargs)
-                cls._instances[cls] = instance
-        return cls._instances[cls]
+        # The lock is only needed to create the instance once; menus reach
+        # the existing context many times per action.
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
 
 
 class MenuContext(metaclass=SingletonMeta):
@@ -383,7 +397,7 @@ class ListSelectionMenu(Menu):
         elif issubclass(self._options, enum.Enum):
             return get_enum_string_list(self._options)
         # if options is algorithm
-        elif inspect.isclass(self._options):
+        elif isinstance(self._options, type):
             return get_class_string_list(self._options)
 
     def menu_action(self) -> None:
@@ -465,7 +479,7 @@ class GlobalExecutionMenu(Menu):
 
     _menu_strings = MenuStrings.GlobalExecution
     _options = list(IMCControl.PARAMETERS)
-    _filter = [ParameterName.IMC_CONTROL_FLOW.value]
+    _filter = frozenset({ParameterName.IMC_CONTROL_FLOW})
 
     def menu_action(self) -> None:
         self.context._change_menu_to(MultipleParametersMenu(self))
@@ -492,17 +506,22 @@ class FlowParametersMenu(Menu):
 
     _menu_strings = MenuStrings.FlowParameters
     _options = []
-    _filter = [ParameterIdentifier.FLOW_TYPE]
+    _filter = frozenset({ParameterIdentifier.FLOW_TYPE})
 
     def __init__(self):
         selected_flow = MenuContext().get_saved_value(
             ParameterIdentifier.FLOW_TYPE
         )
         flow_object = IMCFlow.Base.getSubclassByName(selected_flow)
-        self._options = list(flow_object().PARAMETERS)
-        self._options = sorted(
-            self._options, key=lambda x: x.is_required, reverse=True
-        )
+        self._options = _FLOW_OPTIONS.get(selected_flow)
+        if self._options is None:
+            self._options = _FLOW_OPTIONS[selected_flow] = tuple(
+                sorted(
+                    flow_object().PARAMETERS,
+                    key=lambda x: x.is_required,
+                    reverse=True,
+                )
+            )
         self._algorithm_type = flow_object.type
 
         self._menu_strings = MenuStrings._format_description(
@@ -565,26 +584,23 @@ class MultipleParametersMenu(Menu):
         try:
             self._filter = caller_menu._filter
         except AttributeError:
-            self._filter = []
+            self._filter = frozenset()
         self._set_default_values()
 
     def filter_menu_options(self):
-        self._filtered_parameters = filter(
-            lambda x: x.parameter_name not in self._filter,
-            list(self._original_parameters),
-        )
-        self._filtered_parameters, string_options = list(
-            tee(self._filtered_parameters)
-        )
-        self._string_options = [
-            f"""{x.parameter_name.capitalize()}: <{
-                self.context.get_saved_value(x.identifier)
-        if (self.context.get_saved_value(x.identifier) is not None
-        or x.is_required)
-        else "optional"}>"""
-            for x in string_options
+        self._filtered_parameters = [
+            x
+            for x in self._original_parameters
+            if x.parameter_name not in self._filter
         ]
-        self._filtered_parameters = list(self._filtered_parameters)
+        self._string_options = []
+        for x in self._filtered_parameters:
+            saved_value = self.context.get_saved_value(x.identifier)
+            if saved_value is None and not x.is_required:
+                saved_value = "optional"
+            self._string_options.append(
+                f"{x.parameter_name.capitalize()}: <{saved_value}>"
+            )
 
     def menu_action(self) -> None:
 
@@ -654,13 +670,14 @@ class MultipleParametersMenu(Menu):
         self._caller_menu.next_menu()
 
     def _set_default_values(self):
+        context = MenuContext()
         try:
             for parameter in self._original_parameters:  # Set default params
                 if (
                     parameter.inner_value is not None
                     and parameter.inner_value != ""
                 ):
-                    MenuContext().save_value(
+                    context.save_value(
                         parameter.identifier, parameter.inner_value
                     )
         except AttributeError:
@@ -741,17 +758,19 @@ class AlgorithmParametersMenu(Menu):
 
     _menu_strings = MenuStrings.AlgorithmParameters
     _options = []
-    _filter = [ParameterName.ALGORITHM_TYPE]
+    _filter = frozenset({ParameterName.ALGORITHM_TYPE})
 
     def __init__(self, algorithms):
         self._algorithms = algorithms
         algorithm = algorithms.pop()
         (algorithm_name, algorithm_pattern) = algorithm
-        self._options = list(
-            IMCAlgorithm.Base.getSubclassByName(algorithm_name)(
-                algorithm_pattern
-            ).PARAMETERS
-        )
+        self._options = _ALGORITHM_OPTIONS.get(algorithm)
+        if self._options is None:
+            self._options = _ALGORITHM_OPTIONS[algorithm] = tuple(
+                IMCAlgorithm.Base.getSubclassByName(algorithm_name)(
+                    algorithm_pattern
+                ).PARAMETERS
+            )
         self._menu_strings = MenuStrings._format_description(
             self._menu_strings, algorithm_name
         )
@@ -790,8 +809,9 @@ class MemoryTypeMenu(Menu):
             IMCParameter(self.__ALLOCATOR_IDENTIFIER, True, IMCMemory),
             IMCParameter(self.__MEMORY_TYPE_IDENTIFIER, True, MemoryType),
         ]
-        MenuContext().save_value(self.__ALLOCATOR_IDENTIFIER, None)
-        MenuContext().save_value(self.__MEMORY_TYPE_IDENTIFIER, None)
+        context = MenuContext()
+        context.save_value(self.__ALLOCATOR_IDENTIFIER, None)
+        context.save_value(self.__MEMORY_TYPE_IDENTIFIER, None)
 
     def menu_action(self):
         memory_allocator = self.context.get_saved_value(
@@ -807,10 +827,11 @@ class MemoryTypeMenu(Menu):
                 self.context._change_menu_to(None)
 
     def format_memory_menu_strings(self):
-        memory_block_amount = MenuContext().get_saved_value(
+        context = MenuContext()
+        memory_block_amount = context.get_saved_value(
             ParameterIdentifier.MEMORY_BLOCK_AMOUNT
         )
-        group_total_memory = MenuContext().get_saved_value(
+        group_total_memory = context.get_saved_value(
             ParameterIdentifier.MEMORY_GROUP_OVERALL
         )
 
@@ -820,7 +841,7 @@ class MemoryTypeMenu(Menu):
         if group_total_memory is None:
             group_total_blocks = 0
         else:
-            group_block_size = MenuContext().get_saved_value(
+            group_block_size = context.get_saved_value(
                 ParameterIdentifier.MEMORY_GROUP_SIZE_IN_BYTES
             )
             group_total_blocks = int(group_total_memory) / int(group_block_size)
@@ -866,10 +887,10 @@ class MemoryTypeMenu(Menu):
                 MemoryParametersMenu(memory_options, memory_type)
             )
         else:
-            memory_block_amount = MenuContext().get_saved_value(
+            memory_block_amount = self.context.get_saved_value(
                 ParameterIdentifier.MEMORY_BLOCK_AMOUNT
             )
-            group_total_memory = MenuContext().get_saved_value(
+            group_total_memory = self.context.get_saved_value(
                 ParameterIdentifier.MEMORY_GROUP_OVERALL
             )
             if memory_block_amount or group_total_memory:
@@ -885,10 +906,10 @@ class MemoryTypeMenu(Menu):
         if memory_allocator and memory_type:
             return True
         else:
-            memory_block_amount = MenuContext().get_saved_value(
+            memory_block_amount = self.context.get_saved_value(
                 ParameterIdentifier.MEMORY_BLOCK_AMOUNT
             )
-            group_total_memory = MenuContext().get_saved_value(
+            group_total_memory = self.context.get_saved_value(
                 ParameterIdentifier.MEMORY_GROUP_OVERALL
             )
             return memory_block_amount or group_total_memory
@@ -899,11 +920,13 @@ class MemoryParametersMenu(Menu):
 
     _menu_strings = MenuStrings.MemoryParameters
     _options = []
-    _filter = [
-        ParameterIdentifier.MEMORY_BLOCK_ALLOCATOR_TYPE,
-        ParameterName.MEMORY_ALLOCATOR_TYPE,
-        ParameterIdentifier.MEMORY_GROUP_BLOCK_TYPE,
-    ]
+    _filter = frozenset(
+        {
+            ParameterIdentifier.MEMORY_BLOCK_ALLOCATOR_TYPE,
+            ParameterName.MEMORY_ALLOCATOR_TYPE,
+            ParameterIdentifier.MEMORY_GROUP_BLOCK_TYPE,
+        }
+    )
 
     def __init__(self, options, memory_type):
         self._options = sorted(options, key=lambda x: x.identifier)
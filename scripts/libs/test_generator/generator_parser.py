@@ -17,6 +17,7 @@ import re
 
 from scripts.libs.definitions.errors import XMLGeneratorStatus
 from scripts.libs.definitions.imc import ParameterIdentifier, IMCParameter
+from scripts.libs.definitions.imc import PARAMETER_IDENTIFIERS
 from scripts.libs.definitions.imc import TOOL_NAME
 from scripts.libs.definitions.imc import IMCOpcodeType, IMCTimeType
 from scripts.libs.definitions.imc import IMCAlgorithm, IMCFlow
@@ -35,7 +36,7 @@ def read_csv(path: str):
 
 
 def create_empty_dict(size=1):
-    dict = {key: None for key in ParameterIdentifier}
+    dict = {key: None for key in PARAMETER_IDENTIFIERS}
     if size > 1:
         return [dict.copy() for _ in range(size)]
     else:
@@ -94,7 +95,7 @@ def fill_imc_parameters(test_case, imc_parameters):
         )
 
         if value:
-            if identifier.name == "GLOBAL_TIME_TO_EXECUTE":
+            if identifier == ParameterIdentifier.GLOBAL_TIME_TO_EXECUTE:
                 time_value, unit = re.match(r"(\d+)([A-Z]+)", value).groups()
                 time_node = IMCParameter(
                     identifier,
@@ -130,10 +131,9 @@ def fill_imc_parameters(test_case, imc_parameters):
                 parameter.is_required,
                 parameter.data_type,
                 parameter.parameter_name,
-                parameter.inner_value,
+                str(parameter.inner_value),
             )
-            parameter.inner_value = str(parameter.inner_value)
-            parameters_result.add(parameter)
+            parameters_result.add(node)
 
     if execution_time:
         time_iterations = None
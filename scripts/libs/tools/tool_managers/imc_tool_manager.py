@@ -76,31 +76,29 @@ class ImcToolManager:
         """
         Generates the command to be executed by the os system.
         """
-        exec_path = [
-            self.tool_data.parsed_args.imc_path,
-            self.tool_data.parsed_args.xml_path,
+        parsed_args = self.tool_data.parsed_args
+        _cmd = [
+            parsed_args.imc_path,
+            test_case,
+            "-m",
+            str(int(mem_per_instance)),
         ]
-        _cmd = []
-        exec_path[1] = test_case
-        _cmd.extend(exec_path)
-        _cmd.extend(["-m", str(int(mem_per_instance))])
-        if self.tool_data.parsed_args.blk_size:
-            _cmd.extend(["-b", str(self.tool_data.parsed_args.blk_size)])
-        if self.tool_data.parsed_args.time_to_execute:
+        if parsed_args.blk_size:
+            _cmd.extend(["-b", str(parsed_args.blk_size)])
+        if parsed_args.time_to_execute:
             _cmd.extend(
                 [
                     "--time_to_execute",
-                    str(self.tool_data.parsed_args.time_to_execute),
+                    str(parsed_args.time_to_execute),
                 ]
             )
 
-        _cmd = SystemHandler().os_system.generate_os_command(
-            lpu, self.tool_data.parsed_args.priority, _cmd
-        )
+        os_system = SystemHandler().os_system
+        _cmd = os_system.generate_os_command(lpu, parsed_args.priority, _cmd)
 
-        if SystemHandler().os_system.platform_name == "svos":
-            if self.tool_data.parsed_args.target:
-                _cmd.extend(["-t", str(self.tool_data.parsed_args.target)])
+        if os_system.platform_name == "svos":
+            if parsed_args.target:
+                _cmd.extend(["-t", str(parsed_args.target)])
         return _cmd
 
     def setup(self):
@@ -40,6 +40,17 @@ class Level(IntEnum):
 # Initialize a global LoggerManager instance
 
 
+# Logging level of each verbosity level (0-5).
+_VERBOSITY_LEVELS = {
+    0: LoggerManagerThread.Level.OFF,
+    1: LoggerManagerThread.Level.CRITICAL,
+    2: LoggerManagerThread.Level.ERROR,
+    3: LoggerManagerThread.Level.WARNING,
+    4: LoggerManagerThread.Level.INFO,
+    5: LoggerManagerThread.Level.DEBUG,
+}
+
+
 def get_log_level_from_verbosity(verbosity: int):
     """Converts a verbosity level (0-5) to a LoggerManagerThread.Level.
 
@@ -52,15 +63,7 @@ def get_log_level_from_verbosity(verbosity: int):
     Returns:
         LoggerManagerThread.Level: The corresponding logging level
     """
-    level_map = {
-        0: LoggerManagerThread.Level.OFF,
-        1: LoggerManagerThread.Level.CRITICAL,
-        2: LoggerManagerThread.Level.ERROR,
-        3: LoggerManagerThread.Level.WARNING,
-        4: LoggerManagerThread.Level.INFO,
-        5: LoggerManagerThread.Level.DEBUG,
-    }
-    return level_map.get(verbosity, LoggerManagerThread.Level.WARNING)
+    return _VERBOSITY_LEVELS.get(verbosity, LoggerManagerThread.Level.WARNING)
 
 
 def init_logging(name: str, log_level=None, log_format=None):
@@ -1,6 +1,6 @@
 from scripts.libs.utils.singleton_meta import SingletonMeta
 from scripts.libs.utils.cpu_id import CPUID
-from scripts.libs.data_handlers.memory_data import MemoryData
+from scripts.libs.data_handlers.memory_data import memory_data
 from scripts.libs.utils.environment import EnvironmentInfo
 from scripts.libs.system_handler import SystemHandler
 from scripts.libs.components.loggers.logger_manager import (
@@ -53,11 +53,12 @@ class MemoryHandler(metaclass=SingletonMeta):
                 if single_instance_value == 0:
                     single_instance_value = cache_size
                 # Save detailed info (if desired)
-                MemoryData().data[f"l{desired_level}_line_size"] = line_size
-                MemoryData().data[f"l{desired_level}_ways"] = ways
-                MemoryData().data[f"l{desired_level}_partitions"] = partitions
-                MemoryData().data[f"l{desired_level}_sets"] = sets
-                MemoryData().data[f"l{desired_level}_size"] = cache_size
+                data = memory_data.data
+                data[f"l{desired_level}_line_size"] = line_size
+                data[f"l{desired_level}_ways"] = ways
+                data[f"l{desired_level}_partitions"] = partitions
+                data[f"l{desired_level}_sets"] = sets
+                data[f"l{desired_level}_size"] = cache_size
                 # If per_core is desired, stop after the first instance.
                 if per_core:
                     return single_instance_value
@@ -18,6 +18,7 @@
 This module contains path related functions.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from os.path import isfile, join
 
 from scripts.libs.definitions.paths import DefaultPaths
@@ -29,26 +30,36 @@ __license__ = "Confidential"
 __version__ = "0.1"
 __status__ = "Development"
 
+# Default binary locations, checked when the requested binary is unusable.
+_BIN_PATH = DefaultPaths.COMPILED_TOOL_BINARY + BinaryNames.REGULAR_BINARY
+_VER_PATH = DefaultPaths.COMPILED_TOOL_BINARY + BinaryNames.VERSION_BINARY
+
+
+def _stat(path):
+    """Stats a path, returning None instead of raising if it is unreachable."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
 def verify_binary_exists(imc_path):
     """Write affected files paths on log.
     :return: None
     """
-    bin_path = DefaultPaths.COMPILED_TOOL_BINARY + BinaryNames.REGULAR_BINARY
-    ver_path = DefaultPaths.COMPILED_TOOL_BINARY + BinaryNames.VERSION_BINARY
-
-    if not os.access(imc_path, os.F_OK, follow_symlinks=True):
+    imc_stat = _stat(imc_path)
+    if imc_stat is None:
         print("The path to IMC does not appear to be correct!")
-    elif not os.access(imc_path, os.X_OK, follow_symlinks=True):
+    elif not imc_stat.st_mode & 0o111:
         print("The path does not appear to be executable!")
     else:
         return imc_path
-    if os.path.exists(bin_path):
+    if _stat(_BIN_PATH) is not None:
         print("Default build binary exists!")
-        return bin_path
-    elif os.path.exists(ver_path):
+        return _BIN_PATH
+    elif _stat(_VER_PATH) is not None:
         print("Default build binary with version exists!")
-        return ver_path
+        return _VER_PATH
     else:
         return None  # Was not able to find any binary at default paths
 
@@ -63,6 +74,7 @@ def get_subdirs(dirname):
 
     :return: List
     """
+    dirname = os.fspath(dirname)
     subfolders = []
     if os.path.isdir(dirname):
         subfolders = [f.path for f in os.scandir(dirname) if f.is_dir()]
@@ -77,13 +89,14 @@ def get_files(dirname, file_extension=""):
 
     :return: List
     """
-    files_names = sorted(
-        [
-            os.path.join(dirname, f)
-            for f in os.listdir(dirname)
-            if isfile(join(dirname, f)) and f.endswith(file_extension)
-        ]
-    )
+    dirname = os.fspath(dirname)
+    files_names = []
+    for f in os.listdir(dirname):
+        if f.endswith(file_extension):
+            path = join(dirname, f)
+            if isfile(path):
+                files_names.append(path)
+    files_names.sort()
     return files_names
 
 
@@ -92,8 +105,7 @@ def check_make_dir(path):
 
     :return: status
     """
-    if not os.path.isdir(path):
-        os.makedirs(path)
+    os.makedirs(os.fspath(path), exist_ok=True)
 
 
 def get_files_filter_name(files, names_to_filter):
@@ -115,6 +127,7 @@ def get_dirs(dirname):
 
     :return: List
     """
+    dirname = os.fspath(dirname)
     subfolders = []
     if os.path.isdir(dirname):
         subfolders = [f.path for f in os.scandir(dirname) if f.is_dir()]
@@ -124,12 +137,65 @@ def get_dirs(dirname):
     return subfolders
 
 
+def _scan_dir(dirname, ext=""):
+    """Reads a directory with a single scandir pass.
+
+    The entry types reported by the directory listing are reused, so no extra
+    stat is issued per entry unless the entry is a symlink.
+
+    :return: Tuple (sorted files matching ext, subdirectories)
+    """
+    files, subfolders = [], []
+    with os.scandir(dirname) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subfolders.append(entry.path)
+            elif entry.name.endswith(ext) and entry.is_file():
+                files.append(entry.path)
+    files.sort()
+    return files, subfolders
+
+
+def _walk_files(dirname, ext=""):
+    """Retrieves the files of a directory tree grouped by directory.
+
+    :return: Dict {directory: sorted files matching ext}
+    """
+    files_by_dir = {}
+    pending = [dirname]
+    while pending:
+        folder = pending.pop()
+        files_by_dir[folder], subfolders = _scan_dir(folder, ext)
+        pending.extend(subfolders)
+    return files_by_dir
+
+
 def run_fast_scandir(dir, ext=""):  # dir: str, ext: list
-    subfolders, files = [], []
-    subfolders = get_dirs(dir)
-    subfolders.insert(0, dir)
-    for folder in subfolders:
-        files += get_files(folder, ext)
+    """Retrieves all files recursively, one scandir call per directory.
+
+    Each top level subdirectory is walked in its own worker thread; scandir
+    releases the GIL, so the walk scales with storage latency rather than
+    running one directory at a time. Files of the root directory come first,
+    followed by the files of each subdirectory in sorted path order.
+
+    :return: List
+    """
+    dir = os.fspath(dir)
+    files, top_dirs = _scan_dir(dir, ext)
+
+    files_by_dir = {}
+    if len(top_dirs) > 1:
+        workers = min(len(top_dirs), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for subtree in executor.map(
+                lambda folder: _walk_files(folder, ext), top_dirs
+            ):
+                files_by_dir.update(subtree)
+    elif top_dirs:
+        files_by_dir = _walk_files(top_dirs[0], ext)
+
+    for folder in sorted(files_by_dir):
+        files += files_by_dir[folder]
     return files  # Add a subfolders return if needed (subfolders, files)
 
 
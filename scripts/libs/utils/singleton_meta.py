@@ -22,6 +22,8 @@ a global point of access to that instance. It is commonly used to implement the
 design pattern.
 """
 
+import threading
+
 
 class SingletonMeta(type):
     """
@@ -38,9 +40,12 @@ class SingletonMeta(type):
 
     Attributes:
         _instances (dict): A dictionary to store instances of classes using this metaclass.
+        _lock (threading.RLock): Serializes the creation of new instances.
     """
 
     _instances = {}
+    # Reentrant because a singleton's constructor may create other singletons
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
         """
@@ -67,7 +72,17 @@ class SingletonMeta(type):
             assert obj1 is obj2  # Both variables point to the same instance
             ```
         """
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        # Singletons are mostly reached through bare `Class()` calls, so the
+        # registry must hold strong references; a single `get` keeps the
+        # common already-created path to one dictionary lookup.
+        instance = cls._instances.get(cls)
+        if instance is None:
+            # Worker threads can reach a singleton for the first time
+            # together; only one of them may construct it, and without the
+            # GIL the check above alone does not guarantee that.
+            with SingletonMeta._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
@@ -146,15 +146,16 @@ class StructuredLogger:
             f"IMC Version: {self.version} "
         )
 
-    def _log_with_level(self, level, message):
+    def _log_with_level(self, level, message, *args):
         """
         Log a message with the specified level.
 
         Args:
             level (int): The logging level
             message (str): The message to log
+            *args: Values %-formatted into `message` only if it is emitted
         """
-        LoggerManager().log(self.logger_name, level, message)
+        LoggerManager().log(self.logger_name, level, message, *args)
 
     def start_execution(self):
         """
@@ -261,44 +262,64 @@ class StructuredLogger:
 
         time.sleep(0.5)
 
-    def log_initialization(self, message, level=LoggerManagerThread.Level.INFO):
+    def log_initialization(
+        self, message, *args, level=LoggerManagerThread.Level.INFO
+    ):
         """
         Log a message in the initialization phase with visual formatting.
 
         Args:
             message (str): The message to log
+            *args: Values %-formatted into `message` only if it is emitted
             level (int): The logging level
         """
-        self._log_with_level(level, f"{self.COLOR_PREFIXES['INIT']}{message}")
+        self._log_with_level(
+            level, f"{self.COLOR_PREFIXES['INIT']}{message}", *args
+        )
 
-    def log_setup(self, message, level=LoggerManagerThread.Level.INFO):
+    def log_setup(
+        self, message, *args, level=LoggerManagerThread.Level.INFO
+    ):
         """
         Log a message in the setup phase with visual formatting.
 
         Args:
             message (str): The message to log
+            *args: Values %-formatted into `message` only if it is emitted
             level (int): The logging level
         """
-        self._log_with_level(level, f"{self.COLOR_PREFIXES['SETUP']}{message}")
+        self._log_with_level(
+            level, f"{self.COLOR_PREFIXES['SETUP']}{message}", *args
+        )
 
-    def log_execution(self, message, level=LoggerManagerThread.Level.INFO):
+    def log_execution(
+        self, message, *args, level=LoggerManagerThread.Level.INFO
+    ):
         """
         Log a message in the execution phase with visual formatting.
         Args:
             message (str): The message to log
+            *args: Values %-formatted into `message` only if it is emitted
             level (int): The logging level
         """
-        self._log_with_level(level, f"{self.COLOR_PREFIXES['EXEC']}{message}")
+        self._log_with_level(
+            level, f"{self.COLOR_PREFIXES['EXEC']}{message}", *args
+        )
 
-    def log_post_execution(self, message, level=LoggerManagerThread.Level.INFO):
+    def log_post_execution(
+        self, message, *args, level=LoggerManagerThread.Level.INFO
+    ):
         """
         Log a message in the post-execution phase with visual formatting.
 
         Args:
             message (str): The message to log
+            *args: Values %-formatted into `message` only if it is emitted
             level (int): The logging level
         """
-        self._log_with_level(level, f"{self.COLOR_PREFIXES['POST']}{message}")
+        self._log_with_level(
+            level, f"{self.COLOR_PREFIXES['POST']}{message}", *args
+        )
 
     def log_timeout(self, time_limit, unit="seconds"):
         """
@@ -316,14 +337,14 @@ class StructuredLogger:
         separator = "-" * 40
         self._log_with_level(LoggerManagerThread.Level.INFO, separator)
 
-    def log_error(self, message):
+    def log_error(self, message, *args):
         """Log an error message."""
-        self._log_with_level(LoggerManagerThread.Level.ERROR, message)
+        self._log_with_level(LoggerManagerThread.Level.ERROR, message, *args)
 
-    def log_warning(self, message):
+    def log_warning(self, message, *args):
         """Log a warning message."""
-        self._log_with_level(LoggerManagerThread.Level.WARNING, message)
+        self._log_with_level(LoggerManagerThread.Level.WARNING, message, *args)
 
-    def log_debug(self, message):
+    def log_debug(self, message, *args):
         """Log a debug message."""
-        self._log_with_level(LoggerManagerThread.Level.DEBUG, message)
+        self._log_with_level(LoggerManagerThread.Level.DEBUG, message, *args)